@@ -8,26 +8,60 @@ import re
 import time
 import json
 from datetime import datetime
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def setup_driver():
+
+_MATCH_ID_RE = re.compile(r"/matches/(\d+)")
+
+# Third-party trackers/ads and heavy assets, blocked via CDP
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*.jpg",
+    "*.png",
+    "*.woff2",
+]
+
+# Chrome content settings: 2 = block. Only the anchors/scripts matter for scraping
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+
+def setup_driver(headless=True):
     """Set up Chrome driver with anti-detection measures"""
     options = Options()
-    # Try running without headless first for debugging
-    # options.add_argument("--headless")
+    # Pass headless=False to watch the browser while debugging
+    if headless:
+        options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
     options.add_argument("--window-size=1920,1080")
     
+    # Return at DOMContentLoaded and skip images/CSS/fonts entirely
+    options.page_load_strategy = 'eager'
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+    
     # Add user agent to avoid detection
     options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
@@ -43,6 +77,10 @@ def setup_driver():
     # Remove webdriver flag
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
+    # Drop ads/trackers and static assets at the network layer
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
     return driver
 
 
@@ -104,7 +142,34 @@ def debug_page_state(driver, iteration):
     print("=" * 40)
 
 
-def get_fixture_ids(months=6, timeout=20, retry_attempts=3):
+def first_fixture_href(driver):
+    """Return the href of the first fixture link on the page, or None if there is none"""
+    try:
+        return driver.find_element(By.CSS_SELECTOR, "a[href*='/matches/']").get_attribute("href")
+    except NoSuchElementException:
+        return None
+
+
+def extract_fixture_ids(html, seen_hrefs=None):
+    """Extract fixture IDs from page HTML with one page_source call instead of per-link round-trips
+
+    If `seen_hrefs` is given, hrefs already in it are skipped and new ones are
+    added, so links carried over from a previous month view are not re-parsed.
+    """
+    tree = lxml.html.fromstring(html)
+    ids = set()
+    for href in tree.xpath("//a[contains(@href,'/matches/')]/@href"):
+        if seen_hrefs is not None:
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+        m = _MATCH_ID_RE.search(href)
+        if m:
+            ids.add(int(m.group(1)))
+    return ids
+
+
+def get_fixture_ids(months=6, timeout=20, retry_attempts=3, debug=False):
     """Get EPL fixture IDs with improved error handling"""
     driver = setup_driver()
     results = {
@@ -129,7 +194,8 @@ def get_fixture_ids(months=6, timeout=20, retry_attempts=3):
         handle_popups(driver)
         
         # Debug initial page state
-        debug_page_state(driver, 0)
+        if debug:
+            debug_page_state(driver, 0)
         
         # Wait for some content to load first
         for _ in range(retry_attempts):
@@ -144,35 +210,45 @@ def get_fixture_ids(months=6, timeout=20, retry_attempts=3):
                 time.sleep(3)
         
         fixture_ids = set()
+        seen_hrefs = set()
         
         # Get fixtures from current month first
         print("Getting fixtures from current month...")
-        for a in driver.find_elements(By.CSS_SELECTOR, "a[href*='/matches/']"):
-            href = a.get_attribute("href")
-            m = re.search(r"/matches/(\d+)", href)
-            if m:
-                fixture_ids.add(int(m.group(1)))
+        fixture_ids.update(extract_fixture_ids(driver.page_source, seen_hrefs))
         
         print(f"Found {len(fixture_ids)} fixtures in current month")
         
+        # Try different selectors for the previous month button
+        prev_button_selectors = [
+            ("dayChangeBtn-prev", "ID"),
+            (".Calendar-module_dayChangeBtn__sEvC8", "CSS"),
+            ("button#dayChangeBtn-prev", "CSS"),
+            ("button[aria-label*='previous']", "CSS"),
+            ("button[onclick*='prev']", "CSS")
+        ]
+        successful_selector = None
+        
         # Try to navigate to previous months
         for i in range(1, months):
             print(f"\nAttempting to navigate to previous month {i}...")
             
             # Debug before clicking
-            debug_page_state(driver, i)
+            if debug:
+                debug_page_state(driver, i)
             
-            # Try different selectors for the previous month button
-            prev_button_selectors = [
-                ("dayChangeBtn-prev", "ID"),
-                (".Calendar-module_dayChangeBtn__sEvC8", "CSS"),
-                ("button#dayChangeBtn-prev", "CSS"),
-                ("button[aria-label*='previous']", "CSS"),
-                ("button[onclick*='prev']", "CSS")
-            ]
+            # Snapshot the first fixture link so we can tell when the new month has rendered
+            old_first = first_fixture_href(driver)
+            
+            # Try the selector that worked last month first, then the rest
+            if successful_selector is None:
+                selectors_to_try = prev_button_selectors
+            else:
+                selectors_to_try = [successful_selector] + [
+                    s for s in prev_button_selectors if s != successful_selector
+                ]
             
             button_clicked = False
-            for selector, selector_type in prev_button_selectors:
+            for selector, selector_type in selectors_to_try:
                 try:
                     if selector_type == "ID":
                         prev_btn = driver.find_element(By.ID, selector)
@@ -206,22 +282,26 @@ def get_fixture_ids(months=6, timeout=20, retry_attempts=3):
                     print(f"Error with selector {selector_type} '{selector}': {e}")
                     continue
             
-            if not button_clicked:
+            if button_clicked:
+                successful_selector = (selector, selector_type)
+            else:
                 error_msg = f"Could not find or click previous month button at iteration {i}"
                 print(error_msg)
                 results['errors'].append(error_msg)
                 break
             
-            # Wait for page content to refresh
-            time.sleep(3)
+            # Wait for page content to refresh: returns as soon as the first link changes
+            try:
+                WebDriverWait(
+                    driver, timeout,
+                    ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+                ).until(lambda d: first_fixture_href(d) != old_first)
+            except TimeoutException:
+                print(f"Fixture list did not change within {timeout}s after month {i} click")
             
             # Look for new fixtures
             old_count = len(fixture_ids)
-            for a in driver.find_elements(By.CSS_SELECTOR, "a[href*='/matches/']"):
-                href = a.get_attribute("href")
-                m = re.search(r"/matches/(\d+)", href)
-                if m:
-                    fixture_ids.add(int(m.group(1)))
+            fixture_ids.update(extract_fixture_ids(driver.page_source, seen_hrefs))
             
             new_count = len(fixture_ids)
             print(f"Found {new_count - old_count} new fixtures in month {i}")
@@ -246,13 +326,17 @@ def save_results(results, filename="epl_fixtures_results.json"):
     """Save results to JSON file"""
     results['timestamp'] = datetime.now().isoformat()
     
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        # Single C-level serialization, written as bytes
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
     
-    # Also save just the fixture IDs to a simple text file
+    # Also save just the fixture IDs to a simple text file, in one write
     with open("epl_fixture_ids.txt", 'w') as f:
-        for fid in results['fixtures']:
-            f.write(f"{fid}\n")
+        f.write("".join(f"{fid}\n" for fid in results['fixtures']))
     
     print(f"\nResults saved to {filename}")
     print(f"Fixture IDs saved to epl_fixture_ids.txt")
@@ -1,107 +1,377 @@
-import time
 import re
 import json
+import asyncio
+import functools
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
 import pandas as pd
-from bs4 import BeautifulSoup
+import httpx
+import requests
+import zstandard
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import pyjson5
+except ImportError:
+    # Optional C extension; without it we fall back to the regex converter below
+    pyjson5 = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+MATCH_URL = "https://www.whoscored.com/matches/{match_id}/live"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+HTTP_TIMEOUT = 20
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+}
+# Third-party trackers/ads and heavy assets, blocked via CDP
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*.jpg",
+    "*.png",
+    "*.woff2",
+]
+# Chrome content settings: 2 = block. Only the inline scripts matter for scraping
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# With HTTP/2 many requests multiplex over a few long-lived connections, so keep
+# the connection count small and the keep-alive long
+HTTP2_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60)
+
+# Finished matches never change, so their parsed matchCentreData is cached here
+CACHE_DIR = Path("cache")
+CACHE_ZSTD_LEVEL = 3
+
+# Minutes fit in int16 and percentages/ratings in float32; halves per-frame memory.
+# minute is the nullable Int16 (as in ws/parse.py) so a missing minute becomes <NA>
+# instead of failing the cast
+POSSESSION_DTYPES = {"minute": "Int16", "pct_home": "float32", "pct_away": "float32"}
+RATING_DTYPES = {"minute": "Int16", "rating": "float32"}
+
+# Compiled once at import; these run over every (large) match page
+_KEY_RE = re.compile(r'([{,]\s*)([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:')
+_SQ_RE = re.compile(r"(?<!\\)'")
+_ARGS_RE = re.compile(r'require\.config\.params\["args"\]\s*=\s*({.*?});', re.DOTALL)
+
+def _build_session() -> requests.Session:
+    """Build the pooled HTTP session shared by every match fetch"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+# Reused across all match IDs so keep-alive connections amortize the TLS handshake
+SESSION = _build_session()
+
+# Pure str -> str, so repeated parses of the same dump (e.g. while iterating on
+# debug output) can skip the regex passes entirely. Each entry pins the input and
+# output blobs (hundreds of KB per match), so only the last couple are kept.
+@functools.lru_cache(maxsize=2)
 def js_object_to_json(js_text: str) -> str:
-    """Convert JavaScript object to JSON string"""
+    """Convert JavaScript object to JSON string (fallback when pyjson5 is unavailable)"""
     # Quote unquoted keys: keyName: → "keyName":
-    js_text = re.sub(r'([{,]\s*)([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:', r'\1"\2":', js_text)
+    js_text = _KEY_RE.sub(r'\1"\2":', js_text)
     # Replace single quotes with double quotes, but handle escaped quotes
-    js_text = re.sub(r"(?<!\\)'", '"', js_text)
-    # Handle boolean values
-    js_text = re.sub(r'\btrue\b', 'true', js_text)
-    js_text = re.sub(r'\bfalse\b', 'false', js_text)
-    # Handle null values
-    js_text = re.sub(r'\bnull\b', 'null', js_text)
+    # (true/false/null are already valid JSON and need no rewrite)
+    js_text = _SQ_RE.sub('"', js_text)
     return js_text
 
-def fetch_match_centre_data(match_id: str) -> dict:
-    """Fetch matchCentreData from whoscored.com using Selenium"""
-    url = f"https://www.whoscored.com/matches/{match_id}/live"
-    
+def extract_args_js(html: str):
+    """Return the raw require.config.params["args"] object literal, or None if absent"""
+    # The assignment only appears in the inline layout-wrapper script, so search the
+    # raw page directly rather than building a DOM tree to isolate that one tag
+    match = _ARGS_RE.search(html)
+    return match.group(1) if match else None
+
+def fetch_html_http(match_id: str) -> str:
+    """Fetch the raw match page over the shared HTTP session"""
+    response = SESSION.get(MATCH_URL.format(match_id=match_id), timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+def setup_chrome_driver() -> webdriver.Chrome:
+    """Start a headless Chrome configured for match pages"""
     # Setup headless Chrome
     chrome_opts = Options()
     chrome_opts.add_argument("--headless=new")
     chrome_opts.add_argument("--disable-gpu")
     chrome_opts.add_argument("--no-sandbox")
-    chrome_opts.add_argument("--disable-dev-shm-usage")
     chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    chrome_opts.add_argument("--disable-extensions")
+    chrome_opts.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_opts.add_argument(f"user-agent={USER_AGENT}")
+    # Return at DOMContentLoaded and skip images/CSS/fonts entirely
+    chrome_opts.page_load_strategy = 'eager'
+    chrome_opts.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
     
     # For Selenium 4.6+, this automatically manages the driver
     driver = webdriver.Chrome(options=chrome_opts)
     
+    # Drop ads/trackers and static assets at the network layer
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
+    return driver
+
+class BrowserPool:
+    """Up to `size` warm Chrome drivers shared across match fetches.
+
+    Drivers are started lazily on first demand and handed out one caller at a
+    time; cookies are cleared between uses instead of quitting the browser.
+    """
+
+    def __init__(self, size: int = 4):
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> webdriver.Chrome:
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if len(self._drivers) < self.size:
+                        driver = setup_chrome_driver()
+                        self._drivers.append(driver)
+                        return driver
+                # Pool is full, wait for a driver (or a freed slot) to be released
+                driver = self._idle.get()
+            if driver is not None:
+                return driver
+            # None marks the slot of a discarded driver: loop round to start a replacement
+
+    def _discard(self, driver: webdriver.Chrome):
+        """Quit a broken driver and free its slot, waking one waiting borrower"""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Already dead
+        self._idle.put(None)
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of the with-block"""
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            # A crashed driver fails here; don't let that mask the with-block's own
+            # exception, and don't hand the dead driver to the next borrower
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                print(f"Discarding broken pooled driver: {type(e).__name__}: {e}")
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+
+    def close(self):
+        """Quit every driver started by the pool"""
+        with self._lock:
+            for driver in self._drivers:
+                driver.quit()
+            self._drivers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def fetch_html_selenium(match_id: str, driver: webdriver.Chrome) -> str:
+    """Render the match page in Chrome (fallback for JS-gated content)"""
+    driver.get(MATCH_URL.format(match_id=match_id))
+    
+    # Wait until the layout-wrapper script actually carries the payload instead of
+    # sleeping a fixed interval; find_element misses are retried by WebDriverWait
+    wait = WebDriverWait(driver, 20)
+    wait.until(
+        lambda d: "matchCentreData" in d.find_element(
+            By.CSS_SELECTOR, "div#layout-wrapper > script"
+        ).get_attribute("innerHTML")
+    )
+    
+    return driver.page_source
+
+def _fetch_html_pooled(pool: BrowserPool, match_id: str) -> str:
+    """Render a match page on a driver borrowed from `pool`"""
+    with pool.driver() as driver:
+        return fetch_html_selenium(match_id, driver)
+
+def _cache_path(match_id: str) -> Path:
+    return CACHE_DIR / f"mcd_{match_id}.json.zst"
+
+def load_cached(match_id: str):
+    """Return cached matchCentreData for a match, or None on a cache miss"""
+    cache_path = _cache_path(match_id)
+    if not cache_path.exists():
+        return None
+    return _json_loads(zstandard.ZstdDecompressor().decompress(cache_path.read_bytes()))
+
+def store_cached(match_id: str, match_centre_data: dict) -> None:
+    """Cache matchCentreData for a finished match; live/upcoming matches are skipped"""
+    # ftScore is only populated once the match is over
+    if not match_centre_data.get("ftScore"):
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(match_centre_data).encode("utf-8")
+    _cache_path(match_id).write_bytes(zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL).compress(payload))
+
+def fetch_match_centre_data(match_id: str, debug: bool = False, driver: webdriver.Chrome = None, use_cache: bool = True) -> dict:
+    """Fetch matchCentreData from whoscored.com over HTTP, falling back to Selenium
+
+    Pass an existing `driver` to reuse it for the fallback; otherwise a
+    throwaway Chrome is started only if the fallback is needed.
+    """
+    if use_cache:
+        cached = load_cached(match_id)
+        if cached is not None:
+            return cached
+    
+    raw_js = None
     try:
-        driver.get(url)
-        
-        # Wait for the page to load and JavaScript to execute
-        wait = WebDriverWait(driver, 20)
-        # Wait for the layout-wrapper to be present
-        wait.until(EC.presence_of_element_located((By.ID, "layout-wrapper")))
-        
-        # Additional sleep to ensure all JavaScript has executed
-        time.sleep(8)
-        
-        html = driver.page_source
-        
-        # Parse the HTML
-        soup = BeautifulSoup(html, "lxml")
-        script = soup.select_one("div#layout-wrapper > script")
-        
-        if not script or not script.string:
-            raise RuntimeError("layout-wrapper script tag not found")
-        
-        # Find the require.config.params["args"] object
-        pattern = r'require\.config\.params\["args"\]\s*=\s*({.*?});'
-        match = re.search(pattern, script.string, re.DOTALL)
-        
-        if not match:
-            raise RuntimeError("Could not locate require.config.params['args']")
-        
-        raw_js = match.group(1)
-        
-        # Convert JavaScript object to JSON
-        json_text = js_object_to_json(raw_js)
-        
-        # Save the raw JavaScript and JSON for debugging
+        raw_js = extract_args_js(fetch_html_http(match_id))
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed for match {match_id}: {e}")
+    
+    if raw_js is None:
+        # The args blob is normally in the static HTML; a miss means the page is JS-gated
+        print(f"args not found in static HTML for match {match_id}, falling back to Selenium")
+        owns_driver = driver is None
+        if owns_driver:
+            driver = setup_chrome_driver()
+        try:
+            raw_js = extract_args_js(fetch_html_selenium(match_id, driver))
+        finally:
+            if owns_driver:
+                driver.quit()
+    
+    if raw_js is None:
+        raise RuntimeError("Could not locate require.config.params['args']")
+    
+    match_centre_data = parse_args_js(raw_js, match_id, debug=debug)
+    if use_cache:
+        store_cached(match_id, match_centre_data)
+    return match_centre_data
+
+def load_js_object(raw_js: str):
+    """Parse a JavaScript object literal into Python objects"""
+    if pyjson5 is not None:
+        # pyjson5 reads unquoted keys and single quotes directly in one C-level pass
+        return pyjson5.loads(raw_js)
+    return _json_loads(js_object_to_json(raw_js))
+
+def parse_args_js(raw_js: str, match_id: str, debug: bool = False) -> dict:
+    """Parse the extracted args object literal and return its matchCentreData"""
+    if debug:
+        # Save the raw JavaScript before parsing so failures can be inspected
         with open(f"debug_raw_js_{match_id}.txt", "w", encoding="utf-8") as f:
             f.write(raw_js)
-        
-        with open(f"debug_json_{match_id}.txt", "w", encoding="utf-8") as f:
-            f.write(json_text)
-        
         print(f"\n=== DEBUG: Saved raw JS to debug_raw_js_{match_id}.txt ===")
+    
+    try:
+        args = load_js_object(raw_js)
+    except ValueError as e:
+        # Both pyjson5 and json raise ValueError subclasses on malformed input
+        print(f"JSON parsing failed: {e}")
+        print("Raw JS:", raw_js[:200] + "...")
+        raise
+    
+    if debug:
+        with open(f"debug_json_{match_id}.txt", "w", encoding="utf-8") as f:
+            json.dump(args, f)
         print(f"=== DEBUG: Saved JSON to debug_json_{match_id}.txt ===\n")
         
-        try:
-            args = json.loads(json_text)
-            print("\n=== DEBUG: Extracted args keys ===")
-            print("Keys in args:", list(args.keys()) if isinstance(args, dict) else "args is not a dict")
-            if "matchCentreData" in args:
-                print("matchCentreData found!")
-            else:
-                print("matchCentreData: NOT FOUND")
-                print("Available keys:", list(args.keys()) if isinstance(args, dict) else "N/A")
-            print("=================================\n")
-            
-            return args["matchCentreData"]
-        except json.JSONDecodeError as e:
-            # If JSON parsing fails, try a more robust approach
-            print(f"JSON parsing failed: {e}")
-            print("Raw JS:", raw_js[:200] + "...")
-            raise
-    
-    finally:
-        driver.quit()
+        print("\n=== DEBUG: Extracted args keys ===")
+        print("Keys in args:", list(args.keys()) if isinstance(args, dict) else "args is not a dict")
+        if "matchCentreData" in args:
+            print("matchCentreData found!")
+        else:
+            print("matchCentreData: NOT FOUND")
+            print("Available keys:", list(args.keys()) if isinstance(args, dict) else "N/A")
+        print("=================================\n")
+    
+    return args["matchCentreData"]
+
+async def _fetch_one_async(client: httpx.AsyncClient, sem: asyncio.Semaphore, pool: BrowserPool, match_id: str, debug: bool = False, use_cache: bool = True) -> dict:
+    """Fetch and parse one match, holding a semaphore slot for each network/browser step"""
+    if use_cache:
+        cached = load_cached(match_id)
+        if cached is not None:
+            return cached
+    
+    raw_js = None
+    try:
+        async with sem:
+            response = await client.get(MATCH_URL.format(match_id=match_id))
+            response.raise_for_status()
+        raw_js = extract_args_js(response.text)
+    except httpx.HTTPError as e:
+        print(f"HTTP fetch failed for match {match_id}: {e}")
+    
+    if raw_js is None:
+        print(f"args not found in static HTML for match {match_id}, falling back to Selenium")
+        # Selenium is blocking, so run it on a worker thread to keep the event loop free
+        async with sem:
+            html = await asyncio.to_thread(_fetch_html_pooled, pool, match_id)
+        raw_js = extract_args_js(html)
+    
+    if raw_js is None:
+        raise RuntimeError(f"Could not locate require.config.params['args'] for match {match_id}")
+    
+    match_centre_data = parse_args_js(raw_js, match_id, debug=debug)
+    if use_cache:
+        store_cached(match_id, match_centre_data)
+    return match_centre_data
+
+async def fetch_many_async(match_ids: list, concurrency: int = 8, debug: bool = False, use_cache: bool = True) -> dict:
+    """Fetch matchCentreData for many matches concurrently, at most `concurrency` in flight"""
+    sem = asyncio.Semaphore(concurrency)
+    # Browsers are only started if some page needs the Selenium fallback
+    with BrowserPool(size=max(1, min(len(match_ids), 4))) as pool:
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=HTTP2_LIMITS,
+            headers=HTTP_HEADERS,
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+        ) as client:
+            results = await asyncio.gather(
+                *[_fetch_one_async(client, sem, pool, mid, debug=debug, use_cache=use_cache) for mid in match_ids],
+                return_exceptions=True,
+            )
+    # Failed matches map to their exception so one bad page doesn't sink the batch
+    return dict(zip(match_ids, results))
+
+def fetch_many(match_ids: list, concurrency: int = 8, debug: bool = False, use_cache: bool = True) -> dict:
+    """Synchronous entry point for fetch_many_async"""
+    return asyncio.run(fetch_many_async(match_ids, concurrency=concurrency, debug=debug, use_cache=use_cache))
 
 def process_match_data(match_centre_data: dict):
     """Process match centre data into DataFrames"""
@@ -127,14 +397,14 @@ def process_match_data(match_centre_data: dict):
     # Process possession data
     possession_data = match_centre_data.get("teamPerformance", {}).get("possessionGraph", [])
     if possession_data:
-        pos_df = pd.DataFrame(possession_data, columns=["minute", "pct_home", "pct_away"])
+        pos_df = pd.DataFrame.from_records(possession_data, columns=["minute", "pct_home", "pct_away"]).astype(POSSESSION_DTYPES)
     else:
         pos_df = pd.DataFrame()
     
     # Process player rating data
     rating_data = match_centre_data.get("playerRatingGraph", [])
     if rating_data:
-        rate_df = pd.DataFrame(rating_data, columns=["minute", "rating"])
+        rate_df = pd.DataFrame.from_records(rating_data, columns=["minute", "rating"]).astype(RATING_DTYPES)
     else:
         rate_df = pd.DataFrame()
     
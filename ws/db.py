@@ -2,7 +2,7 @@
 """
 Database module for the WhoScored scraper.
 
-Handles SQLite database connection, schema definition (using SQLAlchemy ORM),
+Handles SQLite database connection, schema definition (using SQLAlchemy Core),
 and provides helper functions for common database operations like upserting
 DataFrames and checking for existing records.
 
@@ -11,210 +11,596 @@ Reflects schema changes from the updated workflow:
 - Updated fields in the MinuteData table to have home/away specifics.
 """
 
+import logging
 import pandas as pd
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
 import os
+import threading
+from typing import Iterable, Optional
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, ForeignKey
-from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy import create_engine, event, select, bindparam, or_, func, DDL, Index, MetaData, Table, Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 
+log = logging.getLogger(__name__)
+
 # --- Configuration ---
 DEFAULT_DB_PATH = "data/ws.db"
 
+# Upper bound on bound parameters per statement (SQLite >= 3.32 allows 32766);
+# sizes the multi-row INSERT chunks in insert_df
+SQLITE_MAX_VARIABLES = 32000
+
+# Ids per IN (...) list in fixtures_exist; stays under SQLite's legacy 999-variable cap
+EXISTS_CHUNK_SIZE = 900
+
+# Applied to every new SQLite connection. WAL + synchronous=NORMAL avoids an fsync
+# per commit; temp tables and a 64 MiB page cache stay in memory. Foreign keys are
+# left unenforced (SQLite's default): fixtures are written without their competition
+# row and minutes may arrive before their fixture, and with enforcement on those
+# upserts fail with "FOREIGN KEY constraint failed".
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# MinuteData percentages and ratings are stored as fixed-point integers
+# (round(value * scale)), an INTEGER being narrower than a REAL. The scale is per
+# column and large enough to keep what the feed sends: percentages carry up to 4
+# decimals, ratings are team averages with long fractions (6.174545...).
+FIXED_POINT_SCALES = {
+    "possession_home": 10_000, "possession_away": 10_000,
+    "rating_home": 1_000_000, "rating_away": 1_000_000,
+    "pass_success_home": 10_000, "pass_success_away": 10_000,
+}
+FIXED_POINT_COLUMNS = tuple(FIXED_POINT_SCALES)
+
+# Seconds a connection waits on a locked database before raising "database is locked"
+SQLITE_BUSY_TIMEOUT = 30
+
+# get_engine uses a StaticPool: one connection shared by every thread, so the
+# helpers below serialize their use of it
+_db_lock = threading.RLock()
+
+# Fixture ids known to exist, per engine (keyed by id(engine)). Fixtures are only
+# ever added during a run, so a hit never goes stale; filled by fixtures_exist
+# lookups and by upserts into the fixtures table.
+_known_fixture_ids: dict[int, set[int]] = {}
+
+# Engines by absolute database path, and the paths whose schema has been created
+# (see get_engine)
+_engine_cache: dict[str, Engine] = {}
+_initialized: set[str] = set()
+
+# Upsert statements keyed by (table name, column tuple, primary key tuple); a scraper
+# only ever produces a handful of distinct column sets
+_upsert_stmt_cache: dict[tuple, object] = {}
+
 # --- SQLAlchemy Setup ---
-Base = declarative_base()
+# Plain Core tables: the scraper only ever bulk-upserts DataFrames and runs simple
+# selects, so there is no mapper, attribute instrumentation or identity map to pay for.
+metadata = MetaData()
+
+# --- Table Definitions ---
+
+# A football competition (league/tournament)
+competitions = Table(
+    "competitions", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("whoscored_id", Integer, unique=True, nullable=True, index=True),
+    Column("name", String, nullable=False, index=True),
+    Column("country", String, nullable=True),
+    Column("season", String, nullable=False),
+    Column("stage", String, nullable=True),
+    Column("scraped_at", DateTime, server_default=func.now()), # Refreshed on UPDATE by trigger
+)
+
+# A single football match (fixture)
+fixtures = Table(
+    "fixtures", metadata,
+    Column("id", Integer, primary_key=True), # WhoScored Match ID
+    Column("competition_id", Integer, ForeignKey("competitions.id"), nullable=True),
+
+    Column("datetime_utc", DateTime, nullable=False), # Indexed via ix_fixtures_dt_comp
+    Column("status", String, nullable=True),
+    Column("round_name", String, nullable=True),
+
+    Column("home_team_id", Integer, nullable=False, index=True),
+    Column("home_team_name", String, nullable=False),
+    Column("away_team_id", Integer, nullable=False, index=True),
+    Column("away_team_name", String, nullable=False),
+
+    Column("home_score", Integer, nullable=True),
+    Column("away_score", Integer, nullable=True),
+
+    Column("referee_name", String, nullable=True),
+    Column("venue_name", String, nullable=True),
+
+    Column("scraped_at", DateTime, server_default=func.now()), # Refreshed on UPDATE by trigger
+
+    # Scraper-side lookups filter fixtures by date window (optionally per competition)
+    # and by status; the composite index also serves plain datetime_utc range scans.
+    Index("ix_fixtures_dt_comp", "datetime_utc", "competition_id"),
+    Index("ix_fixtures_status", "status"),
+)
+
+# Minute-by-minute aggregated home/away statistics for a match
+minutes_data = Table(
+    "minutes_data", metadata,
+    # ON DELETE CASCADE is declared for connections that enable PRAGMA foreign_keys;
+    # the default engine does not (see SQLITE_PRAGMAS)
+    Column("match_id", Integer, ForeignKey("fixtures.id", ondelete="CASCADE"), primary_key=True),
+    Column("minute", Integer, primary_key=True),
+
+    Column("added_time", Integer, nullable=True),
+
+    # Fixed-point: stored value = round(value * FIXED_POINT_SCALES[col]), see to_fixed()
+    Column("possession_home", Integer, nullable=True),
+    Column("possession_away", Integer, nullable=True),
+
+    Column("rating_home", Integer, nullable=True),
+    Column("rating_away", Integer, nullable=True),
+
+    Column("total_shots_home", Integer, nullable=True),
+    Column("total_shots_away", Integer, nullable=True),
+
+    Column("pass_success_home", Integer, nullable=True), # Fixed-point percentage
+    Column("pass_success_away", Integer, nullable=True), # Fixed-point percentage
+
+    Column("dribbles_home", Integer, nullable=True),
+    Column("dribbles_away", Integer, nullable=True),
+
+    Column("aerial_won_home", Integer, nullable=True),
+    Column("aerial_won_away", Integer, nullable=True),
+
+    Column("tackles_home", Integer, nullable=True),
+    Column("tackles_away", Integer, nullable=True),
+
+    Column("corners_home", Integer, nullable=True),
+    Column("corners_away", Integer, nullable=True),
+
+    # Written once on insert; re-upserts never touch it
+    Column("scraped_at", DateTime, server_default=func.now()),
+)
+
+# Narrow (long) layout of the same statistics: one row per match, minute and metric
+# instead of 17 mostly-NULL columns per minute. WITHOUT ROWID stores rows inside
+# the primary-key B-tree, so there is no separate rowid table or PK index.
+class Metric(IntEnum):
+    """Metric codes for minute_metrics; name.lower() is the minutes_data column prefix."""
+    POSSESSION = 1
+    RATING = 2
+    TOTAL_SHOTS = 3
+    PASS_SUCCESS = 4
+    DRIBBLES = 5
+    AERIAL_WON = 6
+    TACKLES = 7
+    CORNERS = 8
+
+minute_metrics = Table(
+    "minute_metrics", metadata,
+    Column("match_id", Integer, ForeignKey("fixtures.id", ondelete="CASCADE"), primary_key=True),
+    Column("minute", Integer, primary_key=True),
+    Column("metric_code", Integer, primary_key=True), # Metric
+    # Same encoding as minutes_data: fixed-point for possession/rating/pass_success
+    Column("home", Integer, nullable=True),
+    Column("away", Integer, nullable=True),
+    sqlite_with_rowid=False,
+)
+
+MINUTE_METRICS_PK = ["match_id", "minute", "metric_code"]
+
+# Read-side view that pivots minute_metrics back to the minutes_data column layout
+MINUTE_METRICS_WIDE_VIEW = DDL(
+    "CREATE VIEW IF NOT EXISTS minute_metrics_wide AS\n"
+    "SELECT match_id, minute,\n    "
+    + ",\n    ".join(
+        f"MAX(CASE WHEN metric_code = {metric.value} THEN {side} END) AS {metric.name.lower()}_{side}"
+        for metric in Metric for side in ("home", "away")
+    )
+    + "\nFROM minute_metrics\nGROUP BY match_id, minute"
+)
+event.listen(minute_metrics, "after_create", MINUTE_METRICS_WIDE_VIEW)
 
-# --- Model Definitions ---
+# --- Row Types ---
+# Lightweight, unmapped records for code that wants attribute access to a row;
+# build one from a result row with e.g. Fixture.from_row(row).
 
-class Competition(Base):
+def _fixed_point(col_name: str) -> property:
     """
-    Represents a football competition (league/tournament).
+    Builds a read-only property that converts a fixed-point column back to a float.
     """
-    __tablename__ = "competitions"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    whoscored_id = Column(Integer, unique=True, nullable=True, index=True)
-    name = Column(String, nullable=False, index=True)
-    country = Column(String, nullable=True)
-    season = Column(String, nullable=False)
-    stage = Column(String, nullable=True)
-    
-    scraped_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    scale = FIXED_POINT_SCALES[col_name]
+    def accessor(self):
+        value = getattr(self, col_name)
+        return None if value is None else value / scale
+    return property(accessor)
+
+class _Row:
+    """Shared constructor for the row dataclasses."""
+    __slots__ = ()
+
+    @classmethod
+    def from_row(cls, row):
+        """Builds an instance from a SQLAlchemy result row."""
+        return cls(**row._mapping)
+
+@dataclass(slots=True)
+class Competition(_Row):
+    """A row of the competitions table."""
+    name: str
+    season: str
+    id: Optional[int] = None
+    whoscored_id: Optional[int] = None
+    country: Optional[str] = None
+    stage: Optional[str] = None
+    scraped_at: Optional[datetime] = None
+
+@dataclass(slots=True)
+class Fixture(_Row):
+    """A row of the fixtures table."""
+    id: int
+    datetime_utc: datetime
+    home_team_id: int
+    home_team_name: str
+    away_team_id: int
+    away_team_name: str
+    competition_id: Optional[int] = None
+    status: Optional[str] = None
+    round_name: Optional[str] = None
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+    referee_name: Optional[str] = None
+    venue_name: Optional[str] = None
+    scraped_at: Optional[datetime] = None
+
+@dataclass(slots=True)
+class MinuteData(_Row):
+    """A row of the minutes_data table; the *_pct/*_value properties undo fixed-point."""
+    match_id: int
+    minute: int
+    added_time: Optional[int] = None
+    possession_home: Optional[int] = None
+    possession_away: Optional[int] = None
+    rating_home: Optional[int] = None
+    rating_away: Optional[int] = None
+    total_shots_home: Optional[int] = None
+    total_shots_away: Optional[int] = None
+    pass_success_home: Optional[int] = None
+    pass_success_away: Optional[int] = None
+    dribbles_home: Optional[int] = None
+    dribbles_away: Optional[int] = None
+    aerial_won_home: Optional[int] = None
+    aerial_won_away: Optional[int] = None
+    tackles_home: Optional[int] = None
+    tackles_away: Optional[int] = None
+    corners_home: Optional[int] = None
+    corners_away: Optional[int] = None
+    scraped_at: Optional[datetime] = None
+
+    possession_home_pct = _fixed_point("possession_home")
+    possession_away_pct = _fixed_point("possession_away")
+    rating_home_value = _fixed_point("rating_home")
+    rating_away_value = _fixed_point("rating_away")
+    pass_success_home_pct = _fixed_point("pass_success_home")
+    pass_success_away_pct = _fixed_point("pass_success_away")
+
+# SQLite has no ON UPDATE clause, so competitions/fixtures refresh scraped_at with a
+# trigger (evaluated in SQLite, no Python datetime per row). Recursive triggers are
+# off by default, and the WHEN clause skips rows whose update already set it.
+SCRAPED_AT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_{table}_scraped_at
+AFTER UPDATE ON {table}
+FOR EACH ROW WHEN NEW.scraped_at IS OLD.scraped_at
+BEGIN
+    UPDATE {table} SET scraped_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END
+"""
+SCRAPED_AT_TRIGGERS = {
+    table: DDL(SCRAPED_AT_TRIGGER.format(table=table.name))
+    for table in (competitions, fixtures)
+}
+for _table, _trigger in SCRAPED_AT_TRIGGERS.items():
+    event.listen(_table, "after_create", _trigger)
 
-    fixtures = relationship("Fixture", back_populates="competition")
+# --- Helper Functions ---
 
-    def __repr__(self):
-        return f"<Competition(id={self.id}, name='{self.name}', season='{self.season}')>"
+def _init_schema(engine, db_path: str):
+    """Creates missing tables, indexes, triggers and views in the database."""
+    try:
+        metadata.create_all(engine)
+        # create_all skips tables that already exist, so add indexes and
+        # triggers introduced after a database was first created
+        for index in fixtures.indexes:
+            index.create(engine, checkfirst=True)
+        with engine.begin() as connection:
+            for trigger in SCRAPED_AT_TRIGGERS.values():
+                connection.execute(trigger)
+            connection.execute(MINUTE_METRICS_WIDE_VIEW)
+        log.debug("Tables created successfully (if they didn't exist) in %s", db_path)
+    except SQLAlchemyError as e:
+        log.error("Error creating tables: %s", e)
+        raise
 
-class Fixture(Base):
+def get_engine(db_path: str = DEFAULT_DB_PATH, create_tables: bool = True):
     """
-    Represents a single football match (fixture).
+    Returns the SQLAlchemy engine for the SQLite database, creating it on first use.
+    Engines are cached per absolute path, so repeated calls (e.g. one per worker)
+    share one engine and the schema check runs at most once per process.
+    The engine holds a single long-lived connection (StaticPool) that may be used
+    from any thread, so SQLITE_PRAGMAS are applied once for the process lifetime.
+    Optionally creates all defined tables if they don't exist.
     """
-    __tablename__ = "fixtures"
+    key = os.path.abspath(db_path)
+    with _db_lock:
+        engine = _engine_cache.get(key)
+        if engine is None:
+            db_dir = os.path.dirname(db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir)
+                log.info("Created database directory: %s", db_dir)
+
+            engine = create_engine(
+                f"sqlite:///{db_path}",
+                connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT},
+                poolclass=StaticPool,
+                future=True,
+            )
+
+            @event.listens_for(engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                for pragma in SQLITE_PRAGMAS:
+                    cursor.execute(pragma)
+                cursor.close()
+
+            _engine_cache[key] = engine
+
+        if create_tables and key not in _initialized:
+            _init_schema(engine, db_path)
+            _initialized.add(key)
+    return engine
 
-    id = Column(Integer, primary_key=True) # WhoScored Match ID
-    competition_id = Column(Integer, ForeignKey("competitions.id"), nullable=True)
-    
-    datetime_utc = Column(DateTime, nullable=False, index=True)
-    status = Column(String, nullable=True)
-    round_name = Column(String, nullable=True)
-    
-    home_team_id = Column(Integer, nullable=False, index=True)
-    home_team_name = Column(String, nullable=False)
-    away_team_id = Column(Integer, nullable=False, index=True)
-    away_team_name = Column(String, nullable=False)
-    
-    home_score = Column(Integer, nullable=True)
-    away_score = Column(Integer, nullable=True)
-    
-    referee_name = Column(String, nullable=True)
-    venue_name = Column(String, nullable=True)
-    
-    scraped_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+def to_fixed(df: pd.DataFrame, cols: Iterable[str] = FIXED_POINT_COLUMNS) -> pd.DataFrame:
+    """
+    Converts parsed values to the fixed-point integers stored in MinuteData.
 
-    competition = relationship("Competition", back_populates="fixtures")
-    minutes_data = relationship("MinuteData", back_populates="fixture", cascade="all, delete-orphan")
+    Every listed column is scaled whatever its dtype (a rating of 7 arrives as an
+    int), so the input must hold parsed values, not stored ones; upsert_df and
+    melt_minutes call this themselves.
 
-    def __repr__(self):
-        return f"<Fixture(id={self.id}, home='{self.home_team_name}', away='{self.away_team_name}', date='{self.datetime_utc.strftime('%Y-%m-%d')}')>"
+    Args:
+        df: DataFrame holding the parsed values (e.g. from parse_minute_data).
+        cols: Columns to convert (keys of FIXED_POINT_SCALES); those missing from
+            df are ignored.
 
-class MinuteData(Base):
+    Returns:
+        A copy of df with each converted column as nullable Int32
+        (value * FIXED_POINT_SCALES[col], rounded).
     """
-    Stores minute-by-minute aggregated data for a match.
-    Updated with new home/away specific fields from the workflow.
+    df = df.copy()
+    for col in cols:
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors='coerce').astype('Float64')
+            df[col] = (values * FIXED_POINT_SCALES[col]).round().astype('Int32')
+    return df
+
+def melt_minutes(df: pd.DataFrame) -> pd.DataFrame:
     """
-    __tablename__ = "minutes_data"
+    Converts a minutes_data-shaped DataFrame into minute_metrics rows.
 
-    match_id = Column(Integer, ForeignKey("fixtures.id"), primary_key=True)
-    minute = Column(Integer, primary_key=True)
-    
-    added_time = Column(Integer, nullable=True)
-    
-    possession_home = Column(Float, nullable=True)
-    possession_away = Column(Float, nullable=True)
-    
-    rating_home = Column(Float, nullable=True)
-    rating_away = Column(Float, nullable=True)
-    
-    # New fields from the updated workflow (home/away specific):
-    total_shots_home = Column(Integer, nullable=True)
-    total_shots_away = Column(Integer, nullable=True)
-    
-    pass_success_home = Column(Float, nullable=True) # Assuming Float (percentage)
-    pass_success_away = Column(Float, nullable=True) # Assuming Float (percentage)
-    
-    dribbles_home = Column(Integer, nullable=True)
-    dribbles_away = Column(Integer, nullable=True)
-    
-    aerial_won_home = Column(Integer, nullable=True)
-    aerial_won_away = Column(Integer, nullable=True)
-    
-    tackles_home = Column(Integer, nullable=True)
-    tackles_away = Column(Integer, nullable=True)
-    
-    corners_home = Column(Integer, nullable=True)
-    corners_away = Column(Integer, nullable=True)
-    
-    scraped_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    fixture = relationship("Fixture", back_populates="minutes_data")
+    Args:
+        df: Wide frame with match_id, minute and <metric>_home/<metric>_away columns,
+            holding parsed (unscaled) values; fixed-point columns are converted
+            with to_fixed.
 
-    def __repr__(self):
-        return f"<MinuteData(match_id={self.match_id}, minute={self.minute})>"
+    Returns:
+        A long frame with match_id, minute, metric_code, home and away; metrics
+        missing from df, and rows where both sides are null, are dropped.
+    """
+    df = to_fixed(df)
+    parts = []
+    for metric in Metric:
+        home_col = f"{metric.name.lower()}_home"
+        away_col = f"{metric.name.lower()}_away"
+        if home_col not in df.columns and away_col not in df.columns:
+            continue
+        part = df.loc[:, ["match_id", "minute"]].copy()
+        part["metric_code"] = int(metric)
+        part["home"] = df[home_col] if home_col in df.columns else None
+        part["away"] = df[away_col] if away_col in df.columns else None
+        parts.append(part)
+    if not parts:
+        return pd.DataFrame(columns=[c.name for c in minute_metrics.columns])
+
+    long_df = pd.concat(parts, ignore_index=True)
+    long_df = long_df[long_df["home"].notna() | long_df["away"].notna()]
+    for col in ("home", "away"):
+        long_df[col] = pd.to_numeric(long_df[col], errors='coerce').round().astype('Int32')
+    return long_df.reset_index(drop=True)
+
+def pivot_minutes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts minute_metrics rows back into the minutes_data column layout.
 
-# --- Helper Functions ---
+    Args:
+        df: Long frame with match_id, minute, metric_code, home and away.
 
-def get_engine(db_path: str = DEFAULT_DB_PATH, create_tables: bool = True):
+    Returns:
+        One row per (match_id, minute) with <metric>_home/<metric>_away columns.
     """
-    Creates and returns a SQLAlchemy engine for the SQLite database.
-    Optionally creates all defined tables if they don't exist.
+    wide = df.pivot(index=["match_id", "minute"], columns="metric_code", values=["home", "away"])
+    wide.columns = [f"{Metric(code).name.lower()}_{side}" for side, code in wide.columns]
+    ordered = [
+        f"{metric.name.lower()}_{side}" for metric in Metric for side in ("home", "away")
+        if f"{metric.name.lower()}_{side}" in wide.columns
+    ]
+    return wide.loc[:, ordered].reset_index()
+
+def _upsert_statement(table: Table, cols: tuple[str, ...], pk_cols: tuple[str, ...]):
     """
-    db_dir = os.path.dirname(db_path)
-    if db_dir and not os.path.exists(db_dir):
-        os.makedirs(db_dir)
-        print(f"Created database directory: {db_dir}")
-
-    engine = create_engine(f"sqlite:///{db_path}")
-    if create_tables:
-        try:
-            Base.metadata.create_all(engine)
-            print(f"Tables created successfully (if they didn't exist) in {db_path}")
-        except SQLAlchemyError as e:
-            print(f"Error creating tables: {e}")
-            raise
-    return engine
-
-def upsert_df(engine, df: pd.DataFrame, table: Base, pk_cols: list[str]):
+    Returns the bound-parameter INSERT ... ON CONFLICT statement for upsert_df,
+    built once per (table, columns, primary key) and reused from _upsert_stmt_cache.
     """
-    Upserts a Pandas DataFrame into the specified SQLAlchemy table.
-    Uses SQLite's 'ON CONFLICT DO UPDATE' for efficiency.
+    key = (table.name, cols, pk_cols)
+    stmt = _upsert_stmt_cache.get(key)
+    if stmt is not None:
+        return stmt
+
+    # Only the columns being written are updated: a column absent from the frame keeps
+    # its stored value instead of being overwritten with NULL. scraped_at is
+    # bookkeeping, not data: it never decides whether a row changed, and is refreshed
+    # by the table's UPDATE trigger (if any), not by the upsert
+    data_cols = [
+        col_name for col_name in cols
+        if col_name not in pk_cols and col_name != 'scraped_at'
+    ]
+    # One parameterized statement for every row: SQLAlchemy runs it as an
+    # executemany over the records list instead of rebuilding a VALUES clause
+    stmt = sqlite_insert(table).values({col: bindparam(col) for col in cols})
+    if data_cols:
+        set_ = {col_name: getattr(stmt.excluded, col_name) for col_name in data_cols}
+        # Skip the UPDATE entirely when every data column is unchanged (IS NOT is NULL-safe)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(pk_cols),
+            set_=set_,
+            where=or_(*[table.c[col_name].is_not(stmt.excluded[col_name]) for col_name in data_cols])
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(pk_cols))
+
+    _upsert_stmt_cache[key] = stmt
+    return stmt
+
+def upsert_df(engine, df: pd.DataFrame, table: Table, pk_cols: list[str]):
+    """
+    Upserts a Pandas DataFrame into the specified SQLAlchemy Core table.
+    Uses SQLite's 'ON CONFLICT DO UPDATE' for efficiency, in a single transaction.
+    A single bound-parameter statement is executed for all records (executemany).
+    Conflicting rows whose data columns are all unchanged are left untouched, so
+    re-scraping the same match writes nothing.
+    Fixed-point columns bound for minutes_data must hold parsed (unscaled) values;
+    they are converted with to_fixed.
     """
     if df.empty:
-        print(f"DataFrame for table '{table.name}' is empty. Nothing to upsert.")
+        log.debug("DataFrame for table '%s' is empty. Nothing to upsert.", table.name)
         return
 
-    missing_pk_cols = [col for col in pk_cols if col not in df.columns]
+    # Project onto the table's columns once, in pandas, rather than per record
+    table_columns = {c.name for c in table.columns}
+    keep_cols = [col for col in df.columns if col in table_columns]
+
+    missing_pk_cols = [col for col in pk_cols if col not in keep_cols]
     if missing_pk_cols:
         raise ValueError(f"Primary key columns {missing_pk_cols} not found in DataFrame for table '{table.name}'.")
 
-    records_to_insert = df.to_dict(orient='records')
-    table_columns = [c.name for c in table.columns]
-    
-    filtered_records = []
-    for record in records_to_insert:
-        filtered_record = {key: value for key, value in record.items() if key in table_columns}
-        for pk_col in pk_cols:
-            if pk_col not in filtered_record and pk_col in record:
-                 filtered_record[pk_col] = record[pk_col]
-        filtered_records.append(filtered_record)
+    if table is minutes_data:
+        df = to_fixed(df, [col for col in FIXED_POINT_COLUMNS if col in keep_cols])
+
+    # One C-level conversion to native Python values (NA/NaN/NaT -> None) instead of
+    # to_dict's per-cell boxing of NumPy scalars
+    values = df.loc[:, keep_cols].to_numpy(dtype=object, na_value=None).tolist()
+    filtered_records = [dict(zip(keep_cols, row)) for row in values]
     
     if not filtered_records:
-        print(f"No valid records to upsert for table '{table.name}' after filtering columns.")
+        log.debug("No valid records to upsert for table '%s' after filtering columns.", table.name)
         return
 
-    update_cols = {
-        col.name: col for col in table.columns if col.name not in pk_cols
-    }
-    
-    stmt = sqlite_insert(table.__table__).values(filtered_records)
-    
-    on_conflict_stmt = stmt.on_conflict_do_update(
-        index_elements=pk_cols,
-        set_={
-            col_name: getattr(stmt.excluded, col_name) for col_name in update_cols
-        }
-    )
+    stmt = _upsert_statement(table, tuple(keep_cols), tuple(pk_cols))
 
     try:
-        with engine.connect() as connection:
-            connection.execute(on_conflict_stmt)
-            connection.commit()
-        print(f"Successfully upserted {len(filtered_records)} records into '{table.name}'.")
+        with _db_lock, engine.begin() as connection:
+            connection.execute(stmt, filtered_records)
+        if table is fixtures:
+            with _db_lock:
+                _known_fixture_ids.setdefault(id(engine), set()).update(
+                    record['id'] for record in filtered_records
+                )
+        log.debug("Successfully upserted %d records into '%s'.", len(filtered_records), table.name)
     except SQLAlchemyError as e:
-        print(f"Error upserting data into '{table.name}': {e}")
+        log.error("Error upserting data into '%s': %s", table.name, e)
         raise
 
-def fixture_exists(engine, match_id: int) -> bool:
+def insert_df(engine, df: pd.DataFrame, table: Table):
     """
-    Checks if a fixture with the given match_id exists in the database.
+    Appends a Pandas DataFrame to the specified table with plain multi-row INSERTs.
+
+    Faster than upsert_df for first-time loads (e.g. competitions) because there is
+    no ON CONFLICT clause; use upsert_df whenever rows may already exist, since a
+    duplicate key here fails the statement and rolls the whole load back.
+
+    Args:
+        engine: Engine returned by get_engine.
+        df: Rows to insert; columns not in the table are dropped.
+        table: Target Core table.
+    """
+    if df.empty:
+        log.debug("DataFrame for table '%s' is empty. Nothing to insert.", table.name)
+        return
+
+    table_columns = {c.name for c in table.columns}
+    keep_cols = [col for col in df.columns if col in table_columns]
+    if not keep_cols:
+        log.debug("No valid columns to insert into table '%s' after filtering columns.", table.name)
+        return
+
+    try:
+        with _db_lock, engine.begin() as connection:
+            df.loc[:, keep_cols].to_sql(
+                table.name, connection, if_exists="append", index=False,
+                method="multi", chunksize=max(1, SQLITE_MAX_VARIABLES // len(keep_cols))
+            )
+        if table is fixtures and 'id' in keep_cols:
+            with _db_lock:
+                _known_fixture_ids.setdefault(id(engine), set()).update(df['id'].tolist())
+        log.debug("Successfully inserted %d records into '%s'.", len(df), table.name)
+    except (SQLAlchemyError, pd.errors.DatabaseError) as e:
+        log.error("Error inserting data into '%s': %s", table.name, e)
+        raise
+
+def fixtures_exist(engine, match_ids: Iterable[int]) -> set[int]:
     """
-    Session = sessionmaker(bind=engine)
-    session = None
+    Returns the subset of match_ids that already exist in the fixtures table.
+    Ids already known to exist (see _known_fixture_ids) are answered without a
+    query; the rest are looked up with one SELECT ... WHERE id IN (...) per
+    EXISTS_CHUNK_SIZE ids, so callers can filter a candidate list with a set difference.
+    """
+    ids = list(dict.fromkeys(match_ids))
+    with _db_lock:
+        known = _known_fixture_ids.setdefault(id(engine), set())
+        found = {match_id for match_id in ids if match_id in known}
+    missing = [match_id for match_id in ids if match_id not in found]
+    if not missing:
+        return found
     try:
-        session = Session()
-        exists_query = session.query(Fixture.id).filter_by(id=match_id).scalar() is not None
-        return exists_query
+        with _db_lock, engine.connect() as connection:
+            for start in range(0, len(missing), EXISTS_CHUNK_SIZE):
+                chunk = missing[start:start + EXISTS_CHUNK_SIZE]
+                rows = connection.execute(select(fixtures.c.id).where(fixtures.c.id.in_(chunk)))
+                found.update(row[0] for row in rows)
+            known.update(found)
     except SQLAlchemyError as e:
-        print(f"Error checking if fixture {match_id} exists: {e}")
-        return False
-    finally:
-        if session:
-            session.close()
+        # Keep what is already known (cache hits, chunks answered before the error)
+        # rather than reporting every fixture as new
+        log.error("Error checking which of %d fixtures exist: %s", len(missing), e)
+    return found
+
+def fixture_exists(engine, match_id: int) -> bool:
+    """
+    Checks if a fixture with the given match_id exists in the database.
+    Thin wrapper around fixtures_exist; prefer that for more than a few ids.
+    """
+    return match_id in fixtures_exist(engine, [match_id])
 
 # --- Example Usage (for testing this module directly) ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(name)s: %(message)s")
     print("Running DB module tests (revised schema V2)...")
     
     test_db_path = "data/test_ws_revised_v2.db" # Using a new test DB file
@@ -223,28 +609,37 @@ if __name__ == "__main__":
         print(f"Removed old test database: {test_db_path}")
 
     engine = get_engine(db_path=test_db_path, create_tables=True)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    db_session = SessionLocal()
 
     # 1. Test Competition Table
     print("\n--- Testing Competition Table ---")
     retrieved_comp_id = None
     try:
-        new_comp = Competition(whoscored_id=252, name="Premier League", country="England", season="2024/2025")
-        db_session.add(new_comp)
-        db_session.commit()
-        db_session.refresh(new_comp)
-        retrieved_comp_id = new_comp.id 
-        print(f"Added competition: {new_comp}")
-
-        retrieved_comp = db_session.query(Competition).filter_by(id=retrieved_comp_id).first()
+        with engine.begin() as conn:
+            result = conn.execute(competitions.insert().values(
+                whoscored_id=252, name="Premier League", country="England", season="2024/2025"
+            ))
+            retrieved_comp_id = result.inserted_primary_key[0]
+            print(f"Added competition with id {retrieved_comp_id}")
+
+            row = conn.execute(select(competitions).where(competitions.c.id == retrieved_comp_id)).first()
+        retrieved_comp = Competition.from_row(row) if row else None
         print(f"Retrieved competition: {retrieved_comp}")
         assert retrieved_comp is not None
         assert retrieved_comp.country == "England"
     except Exception as e:
         print(f"Error during Competition test: {e}")
-        db_session.rollback()
+
+    try:
+        insert_df(engine, pd.DataFrame([
+            {'whoscored_id': 250, 'name': 'Champions League', 'season': '2024/2025'},
+            {'whoscored_id': 253, 'name': 'Championship', 'season': '2024/2025', 'country': 'England'},
+        ]), competitions)
+        with engine.connect() as conn:
+            comp_count = conn.execute(select(func.count()).select_from(competitions)).scalar()
+        print(f"Competitions after insert_df: {comp_count}")
+        assert comp_count == 3
+    except Exception as e:
+        print(f"Error during insert_df test: {e}")
 
     # 2. Test Fixture Table & fixture_exists
     print("\n--- Testing Fixture Table & fixture_exists ---")
@@ -252,15 +647,6 @@ if __name__ == "__main__":
     try:
         if not fixture_exists(engine, 12345):
             print("Fixture 12345 does not exist (correct).")
-        
-        if retrieved_comp_id is None:
-            comp_for_fixture = db_session.query(Competition).filter_by(name="Premier League").first()
-            if not comp_for_fixture:
-                 comp_for_fixture = Competition(whoscored_id=2520, name="Premier League Fallback", country="England", season="2024/2025")
-                 db_session.add(comp_for_fixture)
-                 db_session.commit()
-                 db_session.refresh(comp_for_fixture)
-            retrieved_comp_id = comp_for_fixture.id
 
         fixtures_data = {
             'id': [fixture_id_to_test, 1800002],
@@ -269,11 +655,14 @@ if __name__ == "__main__":
             'status': ['Scheduled', 'Scheduled'],
             'home_team_id': [10, 20],'home_team_name': ['Team A', 'Team C'],
             'away_team_id': [15, 25],'away_team_name': ['Team B', 'Team D'],
+            'venue_name': ['Ground A', 'Ground C'],
         }
         fixtures_df = pd.DataFrame(fixtures_data)
-        upsert_df(engine, fixtures_df, Fixture, pk_cols=['id'])
+        upsert_df(engine, fixtures_df, fixtures, pk_cols=['id'])
 
-        retrieved_fixture = db_session.query(Fixture).filter_by(id=fixture_id_to_test).first()
+        with engine.connect() as conn:
+            row = conn.execute(select(fixtures).where(fixtures.c.id == fixture_id_to_test)).first()
+        retrieved_fixture = Fixture.from_row(row) if row else None
         print(f"Retrieved fixture after upsert: {retrieved_fixture}")
         assert retrieved_fixture is not None and retrieved_fixture.home_team_name == "Team A"
 
@@ -288,16 +677,18 @@ if __name__ == "__main__":
             'home_score': [2], 'away_score': [1]
         }
         updated_fixtures_df = pd.DataFrame(updated_fixtures_data)
-        upsert_df(engine, updated_fixtures_df, Fixture, pk_cols=['id'])
-        
-        db_session.expire(retrieved_fixture)
-        updated_retrieved_fixture = db_session.query(Fixture).filter_by(id=fixture_id_to_test).first()
+        upsert_df(engine, updated_fixtures_df, fixtures, pk_cols=['id'])
+
+        with engine.connect() as conn:
+            row = conn.execute(select(fixtures).where(fixtures.c.id == fixture_id_to_test)).first()
+        updated_retrieved_fixture = Fixture.from_row(row)
         print(f"Retrieved fixture after second upsert (update): {updated_retrieved_fixture}")
         assert updated_retrieved_fixture.status == "FullTime" and updated_retrieved_fixture.home_team_name == "Team A Updated"
+        # venue_name was not in the update frame, so it keeps its stored value
+        assert updated_retrieved_fixture.venue_name == "Ground A"
 
     except Exception as e:
         print(f"Error during Fixture test: {e}")
-        db_session.rollback()
 
     # 3. Test MinuteData Table (with new home/away fields)
     print("\n--- Testing MinuteData Table (home/away fields) ---")
@@ -327,22 +718,54 @@ if __name__ == "__main__":
             }
         ]
         minute_data_df = pd.DataFrame(minute_data_list)
-        upsert_df(engine, minute_data_df, MinuteData, pk_cols=['match_id', 'minute'])
+        upsert_df(engine, minute_data_df, minutes_data, pk_cols=['match_id', 'minute'])
 
-        retrieved_minute_data = db_session.query(MinuteData).filter_by(match_id=fixture_id_to_test, minute=1).first()
+        with engine.connect() as conn:
+            row = conn.execute(select(minutes_data).where(
+                minutes_data.c.match_id == fixture_id_to_test, minutes_data.c.minute == 1
+            )).first()
+        retrieved_minute_data = MinuteData.from_row(row) if row else None
         print(f"Retrieved minute_data for match {fixture_id_to_test}, minute 1: {retrieved_minute_data}")
         assert retrieved_minute_data is not None
         assert retrieved_minute_data.total_shots_home == 1
         assert retrieved_minute_data.total_shots_away == 0
-        assert retrieved_minute_data.pass_success_home == 0.80
+        assert retrieved_minute_data.pass_success_home == 8000
+        assert retrieved_minute_data.pass_success_home_pct == 0.80
+        assert retrieved_minute_data.rating_home_value == 6.5
         assert retrieved_minute_data.corners_away == 1
 
+        # Integer-typed input is scaled like floats (7 -> 7.0, not 0.000007)
+        int_minute_df = pd.DataFrame({
+            'match_id': [fixture_id_to_test], 'minute': [3],
+            'rating_home': [7], 'possession_home': [55],
+        })
+        upsert_df(engine, int_minute_df, minutes_data, pk_cols=['match_id', 'minute'])
+        with engine.connect() as conn:
+            row = conn.execute(select(minutes_data).where(
+                minutes_data.c.match_id == fixture_id_to_test, minutes_data.c.minute == 3
+            )).first()
+        int_minute_data = MinuteData.from_row(row)
+        assert int_minute_data.rating_home == 7_000_000
+        assert int_minute_data.rating_home_value == 7.0
+        assert int_minute_data.possession_home_pct == 55.0
+
     except Exception as e:
         print(f"Error during MinuteData test: {e}")
-        db_session.rollback()
-    finally:
-        if db_session:
-            db_session.close()
+
+    # 4. Test minute_metrics (long layout) round trip
+    print("\n--- Testing minute_metrics (long layout) ---")
+    try:
+        metrics_df = melt_minutes(minute_data_df)
+        upsert_df(engine, metrics_df, minute_metrics, pk_cols=MINUTE_METRICS_PK)
+        stored_df = pd.read_sql(select(minute_metrics), engine)
+        print(f"Stored {len(stored_df)} minute_metrics rows for {minute_data_df['minute'].nunique()} minutes")
+        round_trip = pivot_minutes(stored_df)
+        assert round_trip.loc[0, 'pass_success_home'] == 8000
+        assert round_trip.loc[1, 'corners_home'] == 1
+        view_df = pd.read_sql("SELECT * FROM minute_metrics_wide ORDER BY minute", engine)
+        assert view_df.loc[0, 'rating_away'] == 6_400_000
+    except Exception as e:
+        print(f"Error during minute_metrics test: {e}")
 
     print("\nDB module tests (revised schema V2) finished.")
     # if os.path.exists(test_db_path):
@@ -6,15 +6,29 @@ This module refactors and extends the logic from fetch_epl_fixtures.py
 to provide a reusable function for discovering match IDs for various leagues.
 It handles navigation from a league overview page to the fixtures section,
 and then iterates through previous and next months to collect fixture IDs.
+The default path drives Chrome through Selenium; get_league_fixture_ids_async
+runs the same flow on async Playwright when that package is installed.
 """
 
 import re
 import time
 import json
+import logging
 import os
+import asyncio
+import atexit
+import functools
+import multiprocessing.util
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Tuple, Optional
 
+import lxml.etree
+import lxml.html
+import numpy as np
+import requests
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -23,16 +37,168 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    ElementClickInterceptedException,
     NoSuchElementException,
+    StaleElementReferenceException,
     WebDriverException
 )
-from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
 
 # Default timeout for WebDriverWait
 DEFAULT_TIMEOUT = 20
 # Default number of retry attempts for certain operations
 DEFAULT_RETRY_ATTEMPTS = 3
+# Default user agent for both the Selenium and Playwright browsers
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Connections kept per host in the urllib3 pool that carries WebDriver commands to
+# chromedriver; urllib3's default of 1 serializes overlapping commands
+WEBDRIVER_POOL_MAXSIZE = 10
+
+# Seconds to keep polling for a late-loading popup (consent banners are injected by
+# script after DOMContentLoaded) after each page navigation
+POPUP_WAIT = 3
+# Seconds to wait for fixture links after leaving a month that had none; there is
+# no old link to compare against, so an empty target month can only time out
+EMPTY_MONTH_WAIT = 3
+
+# Default (min, max) seconds of random pause between month clicks in scrape_many_leagues,
+# so parallel workers don't hammer the site in lockstep
+POLITE_DELAY_RANGE = (1.0, 3.0)
+
+# Static assets and analytics blocked via CDP; only the fixture anchors matter for scraping
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.css", "*.mp4",
+    "*/analytics/*",
+]
+
+# Timeout (seconds) for plain-HTTP calendar fetches
+HTTP_TIMEOUT = 15
+# Markers of an anti-bot interstitial instead of the real calendar content
+_CHALLENGE_MARKERS = ("captcha", "incapsula", "cf-chl", "challenge-platform", "access denied")
+
+# Returns every fixture link's href at once; replaces a find_elements call plus one
+# get_attribute round-trip to chromedriver per link
+_FIXTURE_HREFS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]), a => a.getAttribute('href'));"
+)
+
+# Common popups (cookie consents, modals) dismissed after navigation
+POPUP_SELECTORS = (
+    "#onetrust-accept-btn-handler",          # Cookie consent (common ID)
+    "button[aria-label='Accept cookies']",   # Another cookie consent variant
+    ".qc-cmp2-summary-buttons button[mode='primary']", # Yet another consent
+    ".cookie-consent-accept",
+    ".modal-close-button",
+    "[data-dismiss='modal']"
+)
+
+# Clicks the first visible element matching any of arguments[0]; returns its selector or null
+_CLOSE_POPUP_JS = """
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    if (el && el.offsetParent !== null) { el.click(); return sel; }
+}
+return null;
+"""
+
+# Scrolls arguments[0] into view and returns its centre in viewport coordinates
+_SCROLL_AND_CENTER_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center', inline: 'center'});
+const r = el.getBoundingClientRect();
+const x = r.x + r.width / 2, y = r.y + r.height / 2;
+const hit = document.elementFromPoint(x, y);
+return (hit && (hit === el || el.contains(hit))) ? [x, y] : null;
+"""
+
+# Pulls the match ID out of a fixture link's href
+_MATCH_RE = re.compile(r"/matches/(\d+)")
+
+# CSS selector matching fixture links on the calendar
+FIXTURE_LINK_SELECTOR = "a[href*='/matches/']"
+
+# (selector_value, selector_type) candidates, tried in order; see _click_element_robustly
+FIXTURES_TAB_SELECTORS = [
+    ("a[href*='Fixtures']", "CSS"), # Generic
+    ("//a[normalize-space()='Fixtures']", "XPATH"), # Text based
+    ("ul.ws-sub-navigation a[href*='/Fixtures']", "CSS") # More specific
+]
+PREV_MONTH_SELECTORS = [
+    ("dayChangeBtn-prev", "ID"),
+    ("button[id*='dayChangeBtn-prev']", "CSS"), # More specific ID match
+    ("button[aria-label*='previous month i']", "CSS"), # Common aria-label
+    ("button[data-testid='calendar-previous-month']", "CSS"), # Test IDs sometimes exist
+    # Add more specific CSS classes if known, e.g. from debug_page_state
+    # Example: (".Calendar-module_dayChangeBtn__sEvC8.Calendar-module_prev__XXXX", "CSS")
+]
+NEXT_MONTH_SELECTORS = [
+    ("dayChangeBtn-next", "ID"),
+    ("button[id*='dayChangeBtn-next']", "CSS"),
+    ("button[aria-label*='next month i']", "CSS"),
+    ("button[data-testid='calendar-next-month']", "CSS"),
+]
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> Optional[str]:
+    """
+    Resolves the chromedriver binary via webdriver_manager (if installed) once per process.
+
+    ChromeDriverManager().install() checks version metadata (often over the network)
+    on every call, so the result, including a failure (None), is memoized.
+
+    Returns:
+        Path to the chromedriver binary, or None to let Selenium Manager find one.
+    """
+    try:
+        # Imported here so importing this module doesn't pay for webdriver_manager
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None
+    try:
+        return ChromeDriverManager().install()
+    except Exception as e:
+        # Fallback if ChromeDriverManager().install() fails in some environments
+        log.warning("WebDriverManager failed: %s. Falling back to Selenium Manager.", e)
+        return None
+
+def _widen_webdriver_pool(driver: webdriver.Chrome, maxsize: int = WEBDRIVER_POOL_MAXSIZE) -> None:
+    """
+    Raises the keep-alive pool size of the driver's urllib3 PoolManager, so concurrent
+    WebDriver/CDP commands (e.g. while working across tabs) don't queue for one socket.
+
+    Local Chrome drivers don't accept a ClientConfig, so this adjusts the executor's
+    PoolManager in place. That attribute is private to Selenium; when a release
+    moves or replaces it the pool is left at its default and a warning is logged.
+    """
+    pool_manager = getattr(driver.command_executor, "_conn", None)
+    if not isinstance(pool_manager, urllib3.PoolManager) or not hasattr(pool_manager, "connection_pool_kw"):
+        log.warning("Cannot resize the WebDriver connection pool on this Selenium version (%s); "
+                    "keeping its default size", type(pool_manager).__name__)
+        return
+    pool_manager.connection_pool_kw["maxsize"] = maxsize
+    pool_manager.clear()  # Pools are rebuilt lazily with the new size
+    log.debug("WebDriver connection pool maxsize set to %s", maxsize)
+
+# Background services and features a scraping browser never uses
+CHROME_MEMORY_FLAGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    "--js-flags=--max-old-space-size=512",
+)
 
 def setup_driver(headless: bool = True, user_agent: Optional[str] = None) -> webdriver.Chrome:
     """
@@ -49,74 +215,148 @@ def setup_driver(headless: bool = True, user_agent: Optional[str] = None) -> web
     if headless:
         options.add_argument("--headless")
     options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
+    # Don't decode images at all (complements the CDP URL blocklist below)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # Return from driver.get() at DOMContentLoaded instead of waiting for every
+    # ad/tracker sub-resource; callers already wait for the elements they need
+    options.page_load_strategy = 'eager'
+    # Trim per-instance RSS so more Chromes fit on one box when scraping in parallel
+    for flag in CHROME_MEMORY_FLAGS:
+        options.add_argument(flag)
     
     # Standard user agent to avoid detection
-    ua = user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ua = user_agent or DEFAULT_USER_AGENT
     options.add_argument(f"--user-agent={ua}")
     
     # Disable automation flags
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     
-    # Using webdriver_manager to handle driver binaries
+    # Using webdriver_manager to handle driver binaries (resolved once per process)
     # For undetected-chromedriver, the setup would be different:
     # import undetected_chromedriver as uc
     # driver = uc.Chrome(options=options)
-    try:
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-    except ValueError as e:
-        # Fallback if ChromeDriverManager().install() fails in some environments
-        print(f"WebDriverManager failed: {e}. Attempting to use default ChromeDriver path.")
+    driver_path = _chromedriver_path()
+    if driver_path:
+        driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+    else:
+        # Selenium >= 4.11 locates (or downloads) a matching driver itself
         driver = webdriver.Chrome(options=options)
 
+    _widen_webdriver_pool(driver)
+
     # Remove webdriver flag
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
+    # Drop images, fonts, CSS and analytics at the network layer
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
     return driver
 
-def handle_popups(driver: webdriver.Chrome, timeout: int = 5) -> None:
+# Process-wide driver reused across leagues (see get_or_create_driver)
+_DRIVER_SINGLETON: Optional[webdriver.Chrome] = None
+_DRIVER_HEADLESS: Optional[bool] = None
+
+def _driver_is_alive(driver: webdriver.Chrome) -> bool:
+    """Returns True if the driver still has a live browser session."""
+    if driver.session_id is None:
+        return False
+    try:
+        driver.current_url  # Cheap round-trip that fails once the session is gone
+        return True
+    except WebDriverException:
+        return False
+
+def get_or_create_driver(headless: bool = True) -> webdriver.Chrome:
+    """
+    Returns the cached module-level driver, starting a new Chrome only if there is
+    none yet, its session was lost, or it was started with a different headless mode.
+
+    Args:
+        headless: Whether the browser should run in headless mode.
+
+    Returns:
+        A Selenium Chrome WebDriver instance shared by this process.
+    """
+    global _DRIVER_SINGLETON, _DRIVER_HEADLESS
+    if _DRIVER_SINGLETON is not None:
+        if _DRIVER_HEADLESS == headless and _driver_is_alive(_DRIVER_SINGLETON):
+            return _DRIVER_SINGLETON
+        close_driver()
+    _DRIVER_SINGLETON = setup_driver(headless=headless)
+    _DRIVER_HEADLESS = headless
+    return _DRIVER_SINGLETON
+
+def reset_driver_state(driver: webdriver.Chrome) -> None:
+    """Clears cookies and the HTTP cache so the next league starts from a clean browser."""
+    try:
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    except WebDriverException as e:
+        log.warning("Could not reset driver state: %s", e)
+
+def close_driver() -> None:
+    """Quits the cached module-level driver, if any. Safe to call repeatedly."""
+    global _DRIVER_SINGLETON, _DRIVER_HEADLESS
+    driver, _DRIVER_SINGLETON, _DRIVER_HEADLESS = _DRIVER_SINGLETON, None, None
+    if driver is not None:
+        try:
+            driver.quit()
+            log.debug("WebDriver closed.")
+        except WebDriverException as e:
+            log.error("Error closing WebDriver: %s", e)
+
+atexit.register(close_driver)
+
+def handle_popups(driver: webdriver.Chrome, wait: float = 0) -> Optional[str]:
     """
     Handle common popups like cookie consents.
 
+    Runs one script that clicks the first visible element matching POPUP_SELECTORS,
+    so a page without popups costs a single round-trip instead of a wait per selector.
+
     Args:
         driver: The Selenium WebDriver instance.
-        timeout: Time to wait for popup elements.
-    """
-    popup_selectors = [
-        "#onetrust-accept-btn-handler",          # Cookie consent (common ID)
-        "button[aria-label='Accept cookies']",   # Another cookie consent variant
-        ".qc-cmp2-summary-buttons button[mode='primary']", # Yet another consent
-        ".cookie-consent-accept",
-        ".modal-close-button",
-        "[data-dismiss='modal']"
-    ]
-    
-    for selector in popup_selectors:
-        try:
-            # Use a shorter timeout for popups as they might not always be present
-            element = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-            )
-            if element.is_displayed():
-                print(f"Attempting to close popup with selector: {selector}")
-                # Try JS click if normal click is intercepted
-                try:
-                    element.click()
-                except ElementClickInterceptedException:
-                    driver.execute_script("arguments[0].click();", element)
-                print(f"Closed popup with selector: {selector}")
-                time.sleep(1) # Wait a bit for popup to disappear
-        except (NoSuchElementException, TimeoutException):
-            # Element not found or not clickable within timeout, which is fine
-            continue
-        except Exception as e:
-            print(f"Error handling popup with selector {selector}: {e}")
+        wait: Seconds to keep re-running the script until a popup shows up (use
+              POPUP_WAIT after a navigation); 0 checks once.
+
+    Returns:
+        The selector of the popup that was closed, or None if none was visible.
+    """
+    try:
+        if wait > 0:
+            try:
+                selector = WebDriverWait(driver, wait, poll_frequency=0.25).until(
+                    lambda d: d.execute_script(_CLOSE_POPUP_JS, POPUP_SELECTORS)
+                )
+            except TimeoutException:
+                selector = None
+        else:
+            selector = driver.execute_script(_CLOSE_POPUP_JS, POPUP_SELECTORS)
+    except WebDriverException as e:
+        log.error("Error handling popups: %s", e)
+        return None
+    if selector:
+        log.debug("Closed popup with selector: %s", selector)
+    return selector
 
 
+# Writes debug screenshots off the scrape thread; drained at exit so pending writes land
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+atexit.register(_SCREENSHOT_POOL.shutdown, wait=True)
+
+def _write_screenshot(path: str, png: bytes) -> None:
+    """Writes PNG bytes captured by debug_page_state to path."""
+    try:
+        with open(path, "wb") as f:
+            f.write(png)
+        log.debug("Screenshot saved as: %s", path)
+    except OSError as e:
+        log.warning("Failed to save screenshot %s: %s", path, e)
+
 def debug_page_state(driver: webdriver.Chrome, stage_name: str, output_dir: str = "debug_screenshots") -> None:
     """
     Debug function to check current page state and save a screenshot.
@@ -126,9 +366,6 @@ def debug_page_state(driver: webdriver.Chrome, stage_name: str, output_dir: str
         stage_name: A name for the current debugging stage (e.g., "after_nav_to_fixtures").
         output_dir: Directory to save screenshots.
     """
-    print(f"\n=== Debug Info - Stage: {stage_name} ===")
-    print(f"Current URL: {driver.current_url}")
-    
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -136,11 +373,18 @@ def debug_page_state(driver: webdriver.Chrome, stage_name: str, output_dir: str
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     screenshot_name = os.path.join(output_dir, f"debug_{stage_name}_{timestamp}.png")
     try:
-        driver.save_screenshot(screenshot_name)
-        print(f"Screenshot saved as: {screenshot_name}")
+        # Capture on this (the Selenium) thread; only the file write is handed off
+        png = driver.get_screenshot_as_png()
+        _SCREENSHOT_POOL.submit(_write_screenshot, screenshot_name, png)
     except Exception as e:
-        print(f"Failed to save screenshot: {e}")
-    
+        log.warning("Failed to take screenshot: %s", e)
+
+    # The URL and selector probes cost several round-trips; only make them when
+    # their DEBUG output will be seen
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    log.debug("Debug info - stage: %s, current URL: %s", stage_name, driver.current_url)
+
     # Check for common navigation buttons
     calendar_nav_selectors = [
         ("dayChangeBtn-prev", "ID"),
@@ -157,28 +401,277 @@ def debug_page_state(driver: webdriver.Chrome, stage_name: str, output_dir: str
                  elements = driver.find_elements(By.CLASS_NAME, selector.replace(".","")) # remove leading dot for class name search
             else: # Assume CSS selector
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            print(f"Found {len(elements)} elements with {selector_type_desc} '{selector}'")
+            log.debug("Found %s elements with %s '%s'", len(elements), selector_type_desc, selector)
             if elements and elements[0].is_displayed():
-                print(f"  - First element '{selector}' is visible.")
+                log.debug("  - First element '%s' is visible.", selector)
         except Exception:
-            print(f"  - Could not check selector '{selector}'.")
-    print("=" * 40)
+            log.debug("  - Could not check selector '%s'.", selector)
+
+
+def _fixture_ids_from_hrefs(hrefs: List[str]) -> np.ndarray:
+    """Helper function to pull match IDs out of fixture link hrefs into an int64 array (may repeat)."""
+    joined = " ".join(href for href in hrefs if href)
+    return np.fromiter((int(m.group(1)) for m in _MATCH_RE.finditer(joined)), dtype=np.int64)
+
+def _merge_fixture_ids(all_ids: np.ndarray, new_ids: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Merges newly scraped IDs into the sorted, de-duplicated ID array.
 
+    Args:
+        all_ids: Sorted unique IDs collected so far.
+        new_ids: IDs from one more month (unsorted, may repeat).
 
-def _extract_fixture_ids_from_page(driver: webdriver.Chrome) -> Set[int]:
-    """Helper function to extract fixture IDs from the current page."""
-    ids: Set[int] = set()
+    Returns:
+        The merged sorted unique array and the number of IDs that were not in all_ids.
+    """
+    merged = np.unique(np.concatenate((all_ids, new_ids)))
+    return merged, merged.size - all_ids.size
+
+def _extract_fixture_ids_from_page(driver: webdriver.Chrome) -> np.ndarray:
+    """Helper function to extract fixture IDs from the current page in one WebDriver round-trip."""
     try:
-        fixture_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/matches/']")
-        for link in fixture_links:
-            href = link.get_attribute("href")
-            if href:
-                match = re.search(r"/matches/(\d+)", href)
-                if match:
-                    ids.add(int(match.group(1)))
+        hrefs = driver.execute_script(_FIXTURE_HREFS_JS, FIXTURE_LINK_SELECTOR)
     except Exception as e:
-        print(f"Error extracting fixture IDs from page: {e}")
-    return ids
+        log.error("Error extracting fixture IDs from page: %s", e)
+        return np.empty(0, dtype=np.int64)
+    return _fixture_ids_from_hrefs(hrefs or [])
+
+def _first_fixture_href(driver: webdriver.Chrome) -> Optional[str]:
+    """Returns the href of the first fixture link on the page, or None if there is none."""
+    try:
+        return driver.find_element(By.CSS_SELECTOR, FIXTURE_LINK_SELECTOR).get_attribute("href")
+    except NoSuchElementException:
+        return None
+
+def _wait_for_fixtures_change(driver: webdriver.Chrome, old_first_href: Optional[str], timeout: int) -> bool:
+    """
+    Waits until the first fixture link differs from old_first_href, i.e. the calendar
+    has re-rendered after a month click. Returns as soon as it changes; a month with
+    no fixture links (e.g. off-season) counts as a change. Coming from such a month
+    (old_first_href None) only EMPTY_MONTH_WAIT seconds are spent waiting for links.
+
+    Returns:
+        True if the fixture list changed within the wait, False otherwise.
+    """
+    wait = timeout if old_first_href is not None else min(timeout, EMPTY_MONTH_WAIT)
+    try:
+        WebDriverWait(
+            driver, wait,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        ).until(lambda d: _first_fixture_href(d) != old_first_href)
+        return True
+    except TimeoutException:
+        if old_first_href is None:
+            log.debug("No fixture links appeared within %ss; treating the month as empty", wait)
+        else:
+            log.warning("Fixture list did not change within %ss", wait)
+        return False
+
+def _month_urls(month_url_template: str, num_past: int, num_future: int) -> List[str]:
+    """Formats month_url_template for the num_past months before and num_future months after the current one."""
+    today = datetime.now()
+    urls = []
+    for offset in list(range(-num_past, 0)) + list(range(1, num_future + 1)):
+        month_index = today.year * 12 + (today.month - 1) + offset
+        urls.append(month_url_template.format(year=month_index // 12, month=month_index % 12 + 1))
+    return urls
+
+# Keep-alive sessions keyed by user agent, so each browser identity gets its own
+_HTTP_SESSIONS: Dict[str, requests.Session] = {}
+
+def _get_http_session(user_agent: Optional[str] = None) -> requests.Session:
+    """Returns the module's keep-alive requests.Session for user_agent (default: DEFAULT_USER_AGENT)."""
+    ua = user_agent or DEFAULT_USER_AGENT
+    session = _HTTP_SESSIONS.get(ua)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": ua,
+            "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+        _HTTP_SESSIONS[ua] = session
+    return session
+
+def _parse_month_response(url: str, status: int, content_type: str, text: str) -> Optional[np.ndarray]:
+    """
+    Extracts fixture IDs from a calendar response, or returns None if it is unusable
+    (non-200 status, empty or unparseable body, anti-bot challenge, or no fixture links).
+    """
+    if status != 200:
+        log.warning("HTTP fetch for %s returned status %s", url, status)
+        return None
+
+    if not text.strip():
+        log.warning("HTTP fetch for %s returned an empty body", url)
+        return None
+
+    lowered = text[:5000].lower()
+    if any(marker in lowered for marker in _CHALLENGE_MARKERS):
+        log.warning("HTTP fetch for %s hit an anti-bot challenge", url)
+        return None
+
+    if "html" in content_type:
+        try:
+            hrefs = lxml.html.fromstring(text).xpath("//a[contains(@href,'/matches/')]/@href")
+        except lxml.etree.ParserError as e:
+            log.warning("Could not parse HTML from %s: %s", url, e)
+            return None
+        ids = _fixture_ids_from_hrefs(hrefs)
+    else:
+        # JSON feeds embed the match links/ids in strings; scan the raw text
+        ids = np.fromiter((int(m.group(1)) for m in _MATCH_RE.finditer(text)), dtype=np.int64)
+    return ids if ids.size else None
+
+def fetch_month_ids_http(url: str, session: Optional[requests.Session] = None,
+                         user_agent: Optional[str] = None) -> Optional[np.ndarray]:
+    """
+    Fetches one calendar month over plain HTTP (no browser) and extracts its fixture IDs.
+
+    Args:
+        url: Calendar URL for the month (see month_url_template in get_league_fixture_ids).
+        session: Optional requests.Session; defaults to the module's shared session
+                 for user_agent.
+        user_agent: User agent for the default session (ignored when session is given).
+
+    Returns:
+        An int64 array of the month's fixture IDs (may repeat), or None if the request
+        failed, was answered with an anti-bot challenge, or contained no fixture links;
+        callers then fall back to Selenium for that month.
+    """
+    session = session or _get_http_session(user_agent)
+    try:
+        response = session.get(url, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        log.warning("HTTP fetch failed for %s: %s", url, e)
+        return None
+    return _parse_month_response(url, response.status_code, response.headers.get("Content-Type", ""), response.text)
+
+async def fetch_all_months(urls: List[str], concurrency: int = 4,
+                           user_agent: Optional[str] = None) -> List[Optional[np.ndarray]]:
+    """
+    Fetches several calendar months concurrently with aiohttp.
+
+    At most `concurrency` requests are in flight; parsing runs in the default thread
+    pool so it doesn't stall the event loop. A failing month yields None instead of
+    aborting the others.
+
+    Args:
+        urls: Calendar URLs, one per month.
+        concurrency: Maximum number of simultaneous requests.
+        user_agent: User agent to send (default: DEFAULT_USER_AGENT).
+
+    Returns:
+        One entry per URL, in order: the month's fixture IDs, or None (see fetch_month_ids_http).
+    """
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    headers = dict(_get_http_session(user_agent).headers)
+
+    async def fetch_one(session, url: str) -> Optional[np.ndarray]:
+        async with semaphore:
+            async with session.get(url) as response:
+                text = await response.text()
+                status, content_type = response.status, response.headers.get("Content-Type", "")
+        return await loop.run_in_executor(None, _parse_month_response, url, status, content_type, text)
+
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        outcomes = await asyncio.gather(*(fetch_one(session, url) for url in urls), return_exceptions=True)
+
+    month_ids: List[Optional[np.ndarray]] = []
+    for url, outcome in zip(urls, outcomes):
+        if isinstance(outcome, Exception):
+            log.warning("HTTP fetch failed for %s: %s - %s", url, type(outcome).__name__, outcome)
+            month_ids.append(None)
+        else:
+            month_ids.append(outcome)
+    return month_ids
+
+def fetch_months_http(urls: List[str], concurrency: int = 4,
+                      user_agent: Optional[str] = None) -> List[Optional[np.ndarray]]:
+    """
+    Synchronous entry point for fetching months over HTTP: concurrent via
+    fetch_all_months when aiohttp is installed, otherwise one by one with requests.
+    The requests path is also used when called from a running event loop (e.g.
+    Jupyter), where asyncio.run would raise; await fetch_all_months there instead.
+    """
+    try:
+        import aiohttp  # noqa: F401
+        asyncio.get_running_loop()
+    except ImportError:
+        return [fetch_month_ids_http(url, user_agent=user_agent) for url in urls]
+    except RuntimeError:
+        # No running loop: safe to start one
+        return asyncio.run(fetch_all_months(urls, concurrency=concurrency, user_agent=user_agent))
+    log.debug("Event loop already running; fetching %d month(s) sequentially", len(urls))
+    return [fetch_month_ids_http(url, user_agent=user_agent) for url in urls]
+
+def _add_fixture_ids_from_tabs(driver: webdriver.Chrome, urls: List[str], all_fixture_ids: np.ndarray,
+                               results: Dict, timeout: int) -> Tuple[np.ndarray, int]:
+    """
+    Opens every URL in its own tab at once, so the pages load concurrently inside the one
+    browser, then visits each tab in turn to collect its fixture IDs and close it.
+
+    Args:
+        driver: Selenium WebDriver; focus is returned to its current tab afterwards.
+        urls: Calendar URLs to load.
+        all_fixture_ids: Sorted unique IDs collected so far.
+        results: Results dictionary; per-tab failures are appended to results['errors'].
+        timeout: Seconds to wait for fixture links in each tab.
+
+    Returns:
+        The merged sorted unique IDs and the number that were not already in all_fixture_ids.
+    """
+    original_handle = driver.current_window_handle
+    existing_handles = set(driver.window_handles)
+    for url in urls:
+        # window.open returns immediately, unlike driver.get
+        driver.execute_script("window.open(arguments[0], '_blank');", url)
+    new_handles = [h for h in driver.window_handles if h not in existing_handles]
+
+    tab_id_arrays: List[np.ndarray] = []
+    for handle in new_handles:
+        driver.switch_to.window(handle)
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, FIXTURE_LINK_SELECTOR))
+            )
+            tab_id_arrays.append(_extract_fixture_ids_from_page(driver))
+        except TimeoutException:
+            msg = f"No fixture links within {timeout}s in tab {driver.current_url}"
+            results['errors'].append(msg)
+            log.warning(msg)
+        finally:
+            driver.close()
+    driver.switch_to.window(original_handle)
+    if not tab_id_arrays:
+        return all_fixture_ids, 0
+    return _merge_fixture_ids(all_fixture_ids, np.concatenate(tab_id_arrays))
+
+def _cdp_click(driver: webdriver.Chrome, element) -> bool:
+    """
+    Clicks the centre of element with a synthetic DevTools mouse press/release.
+
+    Scrolling and locating happen in one script, and the click needs no scroll-settle
+    pause or Selenium interactability checks (which raise ElementClickInterceptedException).
+    A DevTools click lands on whatever is topmost at the point, so nothing is sent
+    when another element (e.g. a consent overlay) covers the centre.
+
+    Returns:
+        True if the click was dispatched, False if the element's centre is covered.
+    """
+    point = driver.execute_script(_SCROLL_AND_CENTER_JS, element)
+    if not point:
+        return False
+    x, y = point
+    for event_type in ("mousePressed", "mouseReleased"):
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+            "type": event_type, "x": x, "y": y, "button": "left", "clickCount": 1
+        })
+    return True
 
 def _click_element_robustly(driver: webdriver.Chrome, selectors: List[Tuple[str, str]], description: str, timeout: int) -> bool:
     """
@@ -207,36 +700,31 @@ def _click_element_robustly(driver: webdriver.Chrome, selectors: List[Tuple[str,
             elif selector_type.upper() == "XPATH":
                  element = wait.until(EC.element_to_be_clickable((By.XPATH, selector_value)))
             else:
-                print(f"Unsupported selector type: {selector_type}")
+                log.warning("Unsupported selector type: %s", selector_type)
                 continue
 
-            # Scroll to element if necessary
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", element)
-            time.sleep(0.5) # Brief pause after scroll
-
-            element.click()
-            print(f"Successfully clicked {description} using {selector_type} '{selector_value}'")
+            # Callers wait for the resulting page change themselves
+            try:
+                clicked = _cdp_click(driver, element)
+            except WebDriverException as cdp_e:
+                log.warning("CDP click failed for %s with %s '%s': %s. Trying JS click.", description, selector_type, selector_value, cdp_e)
+                clicked = False
+            if clicked:
+                log.debug("Successfully clicked %s using %s '%s'", description, selector_type, selector_value)
+            else:
+                # Covered by an overlay (or CDP failed): a JS click targets the element itself
+                driver.execute_script("arguments[0].click();", element)
+                log.debug("Successfully JS-clicked %s using %s '%s'", description, selector_type, selector_value)
             button_clicked = True
-            time.sleep(2) # Wait for page to potentially update
             return True # Click successful
             
-        except ElementClickInterceptedException:
-            print(f"ElementClickInterceptedException for {description} with {selector_type} '{selector_value}'. Trying JS click.")
-            try:
-                driver.execute_script("arguments[0].click();", element)
-                print(f"Successfully JS-clicked {description} using {selector_type} '{selector_value}'")
-                button_clicked = True
-                time.sleep(2) # Wait for page to potentially update
-                return True # Click successful
-            except Exception as js_e:
-                print(f"JS click also failed for {description} with {selector_type} '{selector_value}': {js_e}")
         except (NoSuchElementException, TimeoutException):
-            print(f"{description} not found or clickable with {selector_type} '{selector_value}'")
+            log.debug("%s not found or clickable with %s '%s'", description, selector_type, selector_value)
         except Exception as e:
-            print(f"Error clicking {description} with {selector_type} '{selector_value}': {e}")
+            log.error("Error clicking %s with %s '%s': %s", description, selector_type, selector_value, e)
     
     if not button_clicked:
-        print(f"Could not find or click {description} using any provided selectors.")
+        log.warning("Could not find or click %s using any provided selectors.", description)
     return button_clicked
 
 
@@ -249,7 +737,11 @@ def get_league_fixture_ids(
     output_dir: str = "data/raw",
     headless: bool = True,
     timeout: int = DEFAULT_TIMEOUT,
-    enable_debugging: bool = False
+    enable_debugging: bool = False,
+    polite_delay: Optional[Tuple[float, float]] = None,
+    driver: Optional[webdriver.Chrome] = None,
+    month_url_template: Optional[str] = None,
+    use_http: bool = True
 ) -> Dict:
     """
     Retrieves fixture IDs for a given league from WhoScored.com.
@@ -264,6 +756,17 @@ def get_league_fixture_ids(
         headless: Whether to run the browser in headless mode.
         timeout: Timeout in seconds for waiting for elements.
         enable_debugging: If True, saves screenshots at various stages.
+        polite_delay: Optional (min, max) seconds; a random pause in that range is
+                      taken before each month click to rate-limit requests.
+        driver: Optional WebDriver to use (and leave open). By default the shared
+                driver from get_or_create_driver is used and only reset afterwards;
+                call close_driver() when done scraping.
+        month_url_template: Optional calendar URL with {year} and {month} fields
+                            (e.g. "...Fixtures/?d={year}{month:02d}"). When given,
+                            the extra months are opened directly in parallel tabs
+                            instead of clicking through the calendar one by one.
+        use_http: With month_url_template, first try each month over plain HTTP
+                  (fetch_month_ids_http) and only open tabs for months that fail.
 
     Returns:
         A dictionary containing:
@@ -273,7 +776,6 @@ def get_league_fixture_ids(
             'total_unique_fixtures': Count of unique fixture IDs.
             'scrape_timestamp': Timestamp of when the scrape finished.
     """
-    driver = None
     results = {
         'fixtures': [],
         'errors': [],
@@ -283,139 +785,155 @@ def get_league_fixture_ids(
     }
     
     try:
-        driver = setup_driver(headless=headless)
-        print(f"Navigating to league overview page: {league_overview_url}")
+        if driver is None:
+            driver = get_or_create_driver(headless=headless)
+        log.info("Navigating to league overview page: %s", league_overview_url)
         driver.get(league_overview_url)
-        time.sleep(3) # Allow initial load
-        handle_popups(driver)
+        handle_popups(driver, wait=POPUP_WAIT)
         if enable_debugging:
             debug_page_state(driver, "initial_load", output_dir)
 
         # Navigate to the "Fixtures" tab/section
-        # Common selectors for "Fixtures" link/tab
-        fixtures_tab_selectors = [
-            ("a[href*='Fixtures']", "CSS"), # Generic
-            ("//a[normalize-space()='Fixtures']", "XPATH"), # Text based
-            ("ul.ws-sub-navigation a[href*='/Fixtures']", "CSS") # More specific
-        ]
-        
-        print("Attempting to navigate to Fixtures page...")
-        if not _click_element_robustly(driver, fixtures_tab_selectors, "Fixtures Tab", timeout):
+        log.debug("Attempting to navigate to Fixtures page...")
+        overview_url = driver.current_url
+        if not _click_element_robustly(driver, FIXTURES_TAB_SELECTORS, "Fixtures Tab", timeout):
             results['errors'].append("Failed to navigate to the Fixtures page from overview.")
             if enable_debugging:
                 debug_page_state(driver, "fixtures_nav_failed", output_dir)
             raise RuntimeError("Could not navigate to Fixtures page.")
         
         # Current URL should now be the main fixtures page with the calendar
+        # (the overview may already show fixture links, so wait for the URL first).
+        # Some leagues render fixtures in place without a navigation; the fixture-link
+        # wait below still decides whether the page is usable.
+        try:
+            WebDriverWait(driver, timeout).until(EC.url_changes(overview_url))
+        except TimeoutException:
+            log.warning("URL did not change after clicking the Fixtures tab; continuing on %s", driver.current_url)
         fixtures_page_url = driver.current_url 
-        print(f"Successfully navigated to Fixtures page: {fixtures_page_url}")
-        time.sleep(2) # Allow fixtures page to load
-        handle_popups(driver) # Handle popups again if they appear on new page
+        log.info("Successfully navigated to Fixtures page: %s", fixtures_page_url)
+        handle_popups(driver, wait=POPUP_WAIT) # Handle popups again if they appear on new page
         
         if enable_debugging:
             debug_page_state(driver, "fixtures_page_loaded", output_dir)
 
         # Wait for at least one fixture link to be present as a sanity check
         WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/matches/']"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, FIXTURE_LINK_SELECTOR))
         )
-        print("Initial fixture links found on the page.")
-
-        all_fixture_ids: Set[int] = set()
+        log.debug("Initial fixture links found on the page.")
 
         # --- Scrape Current Month's View ---
-        print("Scraping current month's view...")
-        current_ids = _extract_fixture_ids_from_page(driver)
-        all_fixture_ids.update(current_ids)
-        print(f"Found {len(current_ids)} fixtures in current view. Total unique: {len(all_fixture_ids)}")
-
-        # --- Scrape Past Months ---
-        prev_button_selectors = [
-            ("dayChangeBtn-prev", "ID"),
-            ("button[id*='dayChangeBtn-prev']", "CSS"), # More specific ID match
-            ("button[aria-label*='previous month i']", "CSS"), # Common aria-label
-            ("button[data-testid='calendar-previous-month']", "CSS"), # Test IDs sometimes exist
-            # Add more specific CSS classes if known, e.g. from debug_page_state
-            # Example: (".Calendar-module_dayChangeBtn__sEvC8.Calendar-module_prev__XXXX", "CSS")
-        ]
-        if num_additional_past_months > 0:
-            print(f"\nScraping {num_additional_past_months} additional past month(s)...")
-            for i in range(num_additional_past_months):
-                print(f"Attempting to navigate to previous month {i+1}/{num_additional_past_months}...")
-                if not _click_element_robustly(driver, prev_button_selectors, "Previous Month Button", timeout):
-                    msg = f"Failed to click 'Previous Month' button on attempt {i+1}."
-                    results['errors'].append(msg)
-                    print(msg)
-                    if enable_debugging:
-                        debug_page_state(driver, f"prev_month_click_failed_{i+1}", output_dir)
-                    break # Stop trying past months if button fails
+        # IDs are kept as a sorted unique int64 array rather than a set of Python ints
+        log.info("Scraping current month's view...")
+        all_fixture_ids = np.unique(_extract_fixture_ids_from_page(driver))
+        log.info("Found %s fixtures in current view.", all_fixture_ids.size)
+
+        if month_url_template:
+            # --- Scrape Past/Future Months in parallel tabs ---
+            month_urls = _month_urls(month_url_template, num_additional_past_months, num_additional_future_months)
+            if use_http:
+                # Plain HTTP first; only months it can't serve go through the browser
+                browser_urls = []
+                month_id_arrays: List[np.ndarray] = [all_fixture_ids]
+                # Present the same user agent as the browser
+                user_agent = driver.execute_script("return navigator.userAgent;")
+                for url, month_ids in zip(month_urls, fetch_months_http(month_urls, user_agent=user_agent)):
+                    if month_ids is None:
+                        browser_urls.append(url)
+                    else:
+                        month_id_arrays.append(month_ids)
+                all_fixture_ids = np.unique(np.concatenate(month_id_arrays))
+                log.info("Fetched %s month(s) over HTTP. Total unique: %s", len(month_urls) - len(browser_urls), len(all_fixture_ids))
+            else:
+                browser_urls = month_urls
+            if browser_urls:
+                log.info("Loading %s additional month(s) in parallel tabs...", len(browser_urls))
+                all_fixture_ids, newly_added = _add_fixture_ids_from_tabs(
+                    driver, browser_urls, all_fixture_ids, results, timeout
+                )
+                log.info("Found %s new fixtures. Total unique: %s", newly_added, len(all_fixture_ids))
+        else:
+            # --- Scrape Past Months ---
+            if num_additional_past_months > 0:
+                log.info("Scraping %s additional past month(s)...", num_additional_past_months)
+                for i in range(num_additional_past_months):
+                    if polite_delay:
+                        time.sleep(random.uniform(*polite_delay))
+                    # Snapshot the first fixture link so we can tell when the new month has rendered
+                    old_first_href = _first_fixture_href(driver)
+                    log.debug("Attempting to navigate to previous month %s/%s...", i+1, num_additional_past_months)
+                    if not _click_element_robustly(driver, PREV_MONTH_SELECTORS, "Previous Month Button", timeout):
+                        msg = f"Failed to click 'Previous Month' button on attempt {i+1}."
+                        results['errors'].append(msg)
+                        log.warning(msg)
+                        if enable_debugging:
+                            debug_page_state(driver, f"prev_month_click_failed_{i+1}", output_dir)
+                        break # Stop trying past months if button fails
                 
-                time.sleep(2) # Wait for month to update
-                handle_popups(driver)
-                if enable_debugging:
-                    debug_page_state(driver, f"past_month_{i+1}", output_dir)
+                    _wait_for_fixtures_change(driver, old_first_href, timeout)
+                    handle_popups(driver)
+                    if enable_debugging:
+                        debug_page_state(driver, f"past_month_{i+1}", output_dir)
 
-                new_ids = _extract_fixture_ids_from_page(driver)
-                newly_added = len(new_ids - all_fixture_ids)
-                all_fixture_ids.update(new_ids)
-                print(f"Found {newly_added} new fixtures. Total unique: {len(all_fixture_ids)}")
+                    all_fixture_ids, newly_added = _merge_fixture_ids(
+                        all_fixture_ids, _extract_fixture_ids_from_page(driver)
+                    )
+                    log.info("Found %s new fixtures. Total unique: %s", newly_added, len(all_fixture_ids))
 
-        # --- Scrape Future Months ---
-        # To reliably scrape future months, first navigate back to the fixtures page (which usually defaults to current month)
-        if num_additional_future_months > 0:
-            print(f"\nResetting to current month's view for future scraping...")
-            driver.get(fixtures_page_url) # Re-navigate to reset calendar
-            time.sleep(3)
-            handle_popups(driver)
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/matches/']"))
-            )
-            if enable_debugging:
-                debug_page_state(driver, "reset_for_future_months", output_dir)
+            # --- Scrape Future Months ---
+            # To reliably scrape future months, first navigate back to the fixtures page (which usually defaults to current month)
+            if num_additional_future_months > 0:
+                log.info("Resetting to current month's view for future scraping...")
+                driver.get(fixtures_page_url) # Re-navigate to reset calendar
+                handle_popups(driver, wait=POPUP_WAIT)
+                WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, FIXTURE_LINK_SELECTOR))
+                )
+                if enable_debugging:
+                    debug_page_state(driver, "reset_for_future_months", output_dir)
             
-            print(f"Scraping {num_additional_future_months} additional future month(s)...")
-            next_button_selectors = [
-                ("dayChangeBtn-next", "ID"),
-                ("button[id*='dayChangeBtn-next']", "CSS"),
-                ("button[aria-label*='next month i']", "CSS"),
-                ("button[data-testid='calendar-next-month']", "CSS"),
-            ]
-            for i in range(num_additional_future_months):
-                print(f"Attempting to navigate to next month {i+1}/{num_additional_future_months}...")
-                if not _click_element_robustly(driver, next_button_selectors, "Next Month Button", timeout):
-                    msg = f"Failed to click 'Next Month' button on attempt {i+1}."
-                    results['errors'].append(msg)
-                    print(msg)
-                    if enable_debugging:
-                        debug_page_state(driver, f"next_month_click_failed_{i+1}", output_dir)
-                    break # Stop trying future months if button fails
+                log.info("Scraping %s additional future month(s)...", num_additional_future_months)
+                for i in range(num_additional_future_months):
+                    if polite_delay:
+                        time.sleep(random.uniform(*polite_delay))
+                    # Snapshot the first fixture link so we can tell when the new month has rendered
+                    old_first_href = _first_fixture_href(driver)
+                    log.debug("Attempting to navigate to next month %s/%s...", i+1, num_additional_future_months)
+                    if not _click_element_robustly(driver, NEXT_MONTH_SELECTORS, "Next Month Button", timeout):
+                        msg = f"Failed to click 'Next Month' button on attempt {i+1}."
+                        results['errors'].append(msg)
+                        log.warning(msg)
+                        if enable_debugging:
+                            debug_page_state(driver, f"next_month_click_failed_{i+1}", output_dir)
+                        break # Stop trying future months if button fails
 
-                time.sleep(2) # Wait for month to update
-                handle_popups(driver)
-                if enable_debugging:
-                    debug_page_state(driver, f"future_month_{i+1}", output_dir)
+                    _wait_for_fixtures_change(driver, old_first_href, timeout)
+                    handle_popups(driver)
+                    if enable_debugging:
+                        debug_page_state(driver, f"future_month_{i+1}", output_dir)
 
-                new_ids = _extract_fixture_ids_from_page(driver)
-                newly_added = len(new_ids - all_fixture_ids)
-                all_fixture_ids.update(new_ids)
-                print(f"Found {newly_added} new fixtures. Total unique: {len(all_fixture_ids)}")
+                    all_fixture_ids, newly_added = _merge_fixture_ids(
+                        all_fixture_ids, _extract_fixture_ids_from_page(driver)
+                    )
+                    log.info("Found %s new fixtures. Total unique: %s", newly_added, len(all_fixture_ids))
 
-        results['fixtures'] = sorted(list(all_fixture_ids))
-        results['total_unique_fixtures'] = len(all_fixture_ids)
+        results['fixtures'] = all_fixture_ids.tolist()
+        results['total_unique_fixtures'] = int(all_fixture_ids.size)
 
     except WebDriverException as e:
         error_msg = f"WebDriverException occurred: {str(e)}"
-        print(error_msg)
+        log.error(error_msg)
         results['errors'].append(error_msg)
         if enable_debugging and driver: # Check if driver exists before taking screenshot
              debug_page_state(driver, "webdriver_exception", output_dir)
     except RuntimeError as e: # Catch custom runtime errors like failure to navigate
         error_msg = f"RuntimeError: {str(e)}"
-        print(error_msg)
+        log.error(error_msg)
         results['errors'].append(error_msg)
     except Exception as e:
         error_msg = f"An unexpected error occurred: {type(e).__name__} - {str(e)}"
-        print(error_msg)
+        log.error(error_msg)
         results['errors'].append(error_msg)
         # Include traceback for unexpected errors if debugging
         import traceback
@@ -423,9 +941,9 @@ def get_league_fixture_ids(
         if enable_debugging and driver:
              debug_page_state(driver, "unexpected_exception", output_dir)
     finally:
+        # Keep Chrome for the next league; just drop this league's cookies and cache
         if driver:
-            driver.quit()
-            print("WebDriver closed.")
+            reset_driver_state(driver)
     
     results['scrape_timestamp'] = datetime.now().isoformat() # Update timestamp to actual end time
 
@@ -434,11 +952,282 @@ def get_league_fixture_ids(
         
     return results
 
+# --- Playwright (async) variant ---
+# Same flow as get_league_fixture_ids, driven over CDP by Playwright instead of
+# Selenium's WebDriver HTTP protocol. Playwright is optional and imported lazily.
+
+def _playwright_selector(selector_value: str, selector_type: str) -> str:
+    """Translates a (selector_value, selector_type) pair into a Playwright selector."""
+    selector_type = selector_type.upper()
+    if selector_type == "ID":
+        return f"#{selector_value}"
+    if selector_type == "XPATH":
+        return f"xpath={selector_value}"
+    if selector_type == "LINK_TEXT":
+        return f"text={selector_value}"
+    return selector_value
+
+async def _handle_popups_async(page) -> Optional[str]:
+    """Clicks the first visible popup from POPUP_SELECTORS, without waiting for any."""
+    # WhoScored shows at most one consent dialog, so stop after the first hit
+    for selector in POPUP_SELECTORS:
+        try:
+            popup = page.locator(selector).first
+            if await popup.is_visible():
+                await popup.click(timeout=2000)
+                log.debug("Closed popup with selector: %s", selector)
+                return selector
+        except Exception as e:
+            log.error("Error handling popup with selector %s: %s", selector, e)
+    return None
+
+async def _click_first_async(page, selectors: List[Tuple[str, str]], description: str, timeout: int) -> bool:
+    """
+    Async counterpart of _click_element_robustly: clicks the first selector that works.
+
+    Args:
+        page: Playwright Page.
+        selectors: A list of (selector_value, selector_type) tuples.
+        description: A description of the element for logging.
+        timeout: Per-selector click timeout in seconds.
+
+    Returns:
+        True if click was successful, False otherwise.
+    """
+    for selector_value, selector_type in selectors:
+        try:
+            # Playwright scrolls into view and waits for actionability itself
+            await page.locator(_playwright_selector(selector_value, selector_type)).first.click(timeout=timeout * 1000)
+            log.debug("Successfully clicked %s using %s '%s'", description, selector_type, selector_value)
+            return True
+        except Exception as e:
+            log.debug("%s not found or clickable with %s '%s': %s", description, selector_type, selector_value, type(e).__name__)
+    log.warning("Could not find or click %s using any provided selectors.", description)
+    return False
+
+async def _extract_fixture_ids_async(page) -> np.ndarray:
+    """Collects every fixture href in one page evaluation and extracts the IDs."""
+    hrefs = await page.eval_on_selector_all(FIXTURE_LINK_SELECTOR, "els => els.map(e => e.href)")
+    return _fixture_ids_from_hrefs(hrefs)
+
+async def _wait_for_fixture_change_async(page, old_first_href: Optional[str], timeout: int) -> None:
+    """
+    Waits until the first fixture link differs from old_first_href (i.e. the month
+    re-rendered); a month without fixture links counts as a change. Coming from
+    such a month only EMPTY_MONTH_WAIT seconds are spent, as in _wait_for_fixtures_change.
+    """
+    if old_first_href is None:
+        timeout = min(timeout, EMPTY_MONTH_WAIT)
+    await page.wait_for_function(
+        """old => {
+            const a = document.querySelector("a[href*='/matches/']");
+            return (a === null ? null : a.href) !== old;
+        }""",
+        arg=old_first_href,
+        timeout=timeout * 1000,
+    )
+
+async def _scrape_months_async(page, selectors, description: str, num_months: int,
+                               all_fixture_ids: np.ndarray, results: Dict, timeout: int) -> np.ndarray:
+    """Clicks through num_months calendar months and returns all_fixture_ids merged with their IDs."""
+    for i in range(num_months):
+        log.debug("Attempting to navigate to %s %s/%s...", description, i+1, num_months)
+        # None when the month has no fixture links (e.g. off-season), like _first_fixture_href
+        old_first_href = await page.evaluate("s => document.querySelector(s)?.href ?? null", FIXTURE_LINK_SELECTOR)
+        if not await _click_first_async(page, selectors, description, timeout):
+            msg = f"Failed to click '{description}' on attempt {i+1}."
+            results['errors'].append(msg)
+            log.warning(msg)
+            break
+        try:
+            await _wait_for_fixture_change_async(page, old_first_href, timeout)
+        except Exception:
+            log.warning("Fixture list did not change within %ss after %s click %s", timeout, description, i+1)
+
+        new_ids = await _extract_fixture_ids_async(page)
+        all_fixture_ids, newly_added = _merge_fixture_ids(all_fixture_ids, new_ids)
+        log.info("Found %s new fixtures. Total unique: %s", newly_added, len(all_fixture_ids))
+    return all_fixture_ids
+
+async def get_league_fixture_ids_async(
+    league_overview_url: str,
+    league_slug: str,
+    num_additional_past_months: int = 3,
+    num_additional_future_months: int = 1,
+    save_file: bool = True,
+    output_dir: str = "data/raw",
+    headless: bool = True,
+    timeout: int = DEFAULT_TIMEOUT,
+    enable_debugging: bool = False,
+    user_agent: Optional[str] = None
+) -> Dict:
+    """
+    Retrieves fixture IDs for a given league using async Playwright instead of Selenium.
+
+    Takes the arguments of get_league_fixture_ids (see there) except polite_delay,
+    driver, month_url_template and use_http, plus user_agent (a custom user agent string),
+    and returns the same dictionary; several leagues can be awaited together under one
+    event loop. Requires the optional `playwright` package and its Chromium build
+    (`pip install playwright && playwright install chromium`).
+    """
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+    results = {
+        'fixtures': [],
+        'errors': [],
+        'league_slug': league_slug,
+        'total_unique_fixtures': 0,
+        'scrape_timestamp': datetime.now().isoformat()
+    }
+
+    playwright = await async_playwright().start()
+    browser = None
+    page = None
+    try:
+        browser = await playwright.chromium.launch(headless=headless)
+        context = await browser.new_context(
+            user_agent=user_agent or DEFAULT_USER_AGENT,
+            viewport={"width": 1920, "height": 1080},
+        )
+        page = await context.new_page()
+
+        log.info("Navigating to league overview page: %s", league_overview_url)
+        await page.goto(league_overview_url, wait_until="domcontentloaded")
+        await _handle_popups_async(page)
+
+        log.debug("Attempting to navigate to Fixtures page...")
+        overview_url = page.url
+        if not await _click_first_async(page, FIXTURES_TAB_SELECTORS, "Fixtures Tab", timeout):
+            results['errors'].append("Failed to navigate to the Fixtures page from overview.")
+            raise RuntimeError("Could not navigate to Fixtures page.")
+
+        # The overview already has fixture links, so wait for the navigation before reading page.url
+        try:
+            await page.wait_for_url(lambda u: u != overview_url, timeout=timeout * 1000)
+        except PlaywrightTimeoutError:
+            log.warning("URL did not change after clicking the Fixtures tab; continuing on %s", page.url)
+        await page.wait_for_selector(FIXTURE_LINK_SELECTOR, timeout=timeout * 1000)
+        fixtures_page_url = page.url
+        log.info("Successfully navigated to Fixtures page: %s", fixtures_page_url)
+        await _handle_popups_async(page)
+        if enable_debugging:
+            os.makedirs(output_dir, exist_ok=True)
+            await page.screenshot(path=os.path.join(output_dir, f"debug_{league_slug}_fixtures_page_loaded.png"))
+
+        all_fixture_ids = np.unique(await _extract_fixture_ids_async(page))
+        log.info("Found %s fixtures in current view.", len(all_fixture_ids))
+
+        if num_additional_past_months > 0:
+            log.info("Scraping %s additional past month(s)...", num_additional_past_months)
+            all_fixture_ids = await _scrape_months_async(page, PREV_MONTH_SELECTORS, "Previous Month Button",
+                                       num_additional_past_months, all_fixture_ids, results, timeout)
+
+        if num_additional_future_months > 0:
+            log.info("Resetting to current month's view for future scraping...")
+            await page.goto(fixtures_page_url, wait_until="domcontentloaded")
+            await page.wait_for_selector(FIXTURE_LINK_SELECTOR, timeout=timeout * 1000)
+            await _handle_popups_async(page)
+            all_fixture_ids = await _scrape_months_async(page, NEXT_MONTH_SELECTORS, "Next Month Button",
+                                       num_additional_future_months, all_fixture_ids, results, timeout)
+
+        results['fixtures'] = all_fixture_ids.tolist()
+        results['total_unique_fixtures'] = int(all_fixture_ids.size)
+
+    except RuntimeError as e:
+        error_msg = f"RuntimeError: {str(e)}"
+        log.error(error_msg)
+        results['errors'].append(error_msg)
+    except Exception as e:
+        error_msg = f"An unexpected error occurred: {type(e).__name__} - {str(e)}"
+        log.error(error_msg)
+        results['errors'].append(error_msg)
+        if enable_debugging and page is not None:
+            try:
+                os.makedirs(output_dir, exist_ok=True)
+                await page.screenshot(path=os.path.join(output_dir, f"debug_{league_slug}_unexpected_exception.png"))
+            except Exception:
+                pass
+    finally:
+        if browser is not None:
+            await browser.close()
+        await playwright.stop()
+        log.info("Playwright browser closed.")
+
+    results['scrape_timestamp'] = datetime.now().isoformat()
+
+    if save_file:
+        _save_results_to_file(results, league_slug, output_dir)
+
+    return results
+
+def get_league_fixture_ids_playwright(*args, **kwargs) -> Dict:
+    """
+    Synchronous wrapper around get_league_fixture_ids_async (runs its own event loop).
+    Accepts the same arguments as get_league_fixture_ids_async.
+    """
+    return asyncio.run(get_league_fixture_ids_async(*args, **kwargs))
+
+
+def _init_scrape_worker() -> None:
+    """
+    Pool initializer: quit the worker's shared driver and finish pending screenshot
+    writes when the worker process exits.
+    """
+    # Pool workers leave via os._exit, which skips atexit; multiprocessing
+    # finalizers with an exitpriority still run (higher priority first)
+    multiprocessing.util.Finalize(None, close_driver, exitpriority=10)
+    multiprocessing.util.Finalize(None, _SCREENSHOT_POOL.shutdown, kwargs={"wait": True}, exitpriority=9)
+
+def scrape_many_leagues(configs: List[Dict], max_workers: int = 4,
+                        polite_delay: Optional[Tuple[float, float]] = POLITE_DELAY_RANGE) -> Dict[str, Dict]:
+    """
+    Scrapes several leagues in parallel, one Chrome per worker process.
+
+    Selenium drivers are not thread-safe, so leagues are spread over processes.
+    Each worker keeps one driver (get_or_create_driver) for all the leagues it
+    handles and quits it when the pool shuts down.
+
+    Args:
+        configs: One dict of get_league_fixture_ids keyword arguments per league
+                 (at least league_overview_url and league_slug).
+        max_workers: Maximum number of concurrent worker processes (and browsers).
+        polite_delay: Default (min, max) pause before each month click, applied to
+                      configs that don't set their own; None disables it.
+
+    Returns:
+        A dictionary mapping each league_slug to its get_league_fixture_ids result.
+    """
+    all_results: Dict[str, Dict] = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_scrape_worker) as executor:
+        futures = {}
+        for cfg in configs:
+            kwargs = dict(cfg)
+            kwargs.setdefault('polite_delay', polite_delay)
+            futures[executor.submit(get_league_fixture_ids, **kwargs)] = cfg['league_slug']
+
+        for future in as_completed(futures):
+            league_slug = futures[future]
+            try:
+                all_results[league_slug] = future.result()
+            except Exception as e:
+                # A worker crash (e.g. Chrome killed) only loses its own league
+                error_msg = f"Worker for {league_slug} failed: {type(e).__name__} - {str(e)}"
+                log.error(error_msg)
+                all_results[league_slug] = {
+                    'fixtures': [],
+                    'errors': [error_msg],
+                    'league_slug': league_slug,
+                    'total_unique_fixtures': 0,
+                    'scrape_timestamp': datetime.now().isoformat()
+                }
+            log.info("League %s done: %s fixtures", league_slug, all_results[league_slug]['total_unique_fixtures'])
+    return all_results
+
 def _save_results_to_file(results: Dict, league_slug: str, output_dir: str = "data/raw") -> None:
     """Saves the scraped fixture data to a JSON file and a simple TXT file."""
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
-        print(f"Created output directory: {output_dir}")
+        log.info("Created output directory: %s", output_dir)
 
     # Filename based on workflow: {league}_{yyyymmdd}.fixtures.json
     date_str = datetime.now().strftime("%Y%m%d")
@@ -446,18 +1235,23 @@ def _save_results_to_file(results: Dict, league_slug: str, output_dir: str = "da
     txt_filename = os.path.join(output_dir, f"{league_slug}_{date_str}_ids.txt")
 
     try:
-        with open(json_filename, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"Results saved to {json_filename}")
+        if orjson is not None:
+            # Single C-level serialization, written as bytes
+            with open(json_filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, 'w') as f:
+                json.dump(results, f, indent=2)
+        log.info("Results saved to %s", json_filename)
 
+        # One joined string and a single write instead of a write per ID
         with open(txt_filename, 'w') as f:
-            for fid in results.get('fixtures', []):
-                f.write(f"{fid}\n")
-        print(f"Fixture IDs saved to {txt_filename}")
+            f.write("".join(f"{fid}\n" for fid in results.get('fixtures', [])))
+        log.info("Fixture IDs saved to %s", txt_filename)
 
     except IOError as e:
         error_msg = f"Error saving results to file: {e}"
-        print(error_msg)
+        log.error(error_msg)
         # Add this error to results if it's part of the main dict,
         # but here it's a post-processing step.
         # For now, just print. If this function is called from get_league_fixture_ids
@@ -465,6 +1259,7 @@ def _save_results_to_file(results: Dict, league_slug: str, output_dir: str = "da
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     print("Starting WhoScored Fixture Scraper (Test Run)...")
     
     # Example Usage: Premier League
@@ -504,6 +1299,15 @@ if __name__ == "__main__":
     else:
         print("\nNo fixture IDs found.")
 
+    close_driver()
+
+    # Example for several leagues in parallel (one Chrome per worker process)
+    # many_results = scrape_many_leagues([
+    #     {"league_overview_url": test_league_url, "league_slug": test_league_slug, "num_additional_past_months": 0},
+    #     {"league_overview_url": "https://www.whoscored.com/Regions/211/Tournaments/4/Spain-La-Liga",
+    #      "league_slug": "spain-la-liga", "num_additional_past_months": 0},
+    # ], max_workers=2)
+
     # Example for a different league (e.g., La Liga)
     # test_league_url_laliga = "https://www.whoscored.com/Regions/211/Tournaments/4/Spain-La-Liga"
     # test_league_slug_laliga = "spain-la-liga"
@@ -8,10 +8,14 @@ match's live page.
 """
 
 import time
+import atexit
 import re
 import json
 import os
-from typing import Dict, Any
+import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -19,19 +23,76 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Parses the JS object literal (unquoted keys, single quotes, trailing commas) directly
+    import pyjson5
+except ImportError:
+    pyjson5 = None
+
+# orjson parses the multi-hundred-KB matchCentreData blob several times faster than json;
+# its JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Default timeout for WebDriverWait
 DEFAULT_TIMEOUT = 20
-# Time to sleep after page load to ensure JavaScript execution
-DEFAULT_SCRIPT_WAIT_TIME = 8
+# Where fetched matchCentreData is cached between runs
+DEFAULT_CACHE_DIR = "data/raw/match_cache"
+# Short grace period if matchCentreData never shows up in the page's JS context
+FALLBACK_SCRIPT_WAIT_TIME = 1
+
+# Truthy once the page's scripts have populated matchCentreData
+_MATCH_DATA_READY_JS = (
+    "return typeof require !== 'undefined' && !!require.config && !!require.config.params"
+    " && !!require.config.params.args && !!require.config.params.args.matchCentreData;"
+)
+# Lets V8 serialize matchCentreData to strict JSON; null if the page structure differs
+_MATCH_DATA_JSON_JS = (
+    "try { return JSON.stringify(require.config.params.args.matchCentreData) || null; }"
+    " catch (e) { return null; }"
+)
+
+# Patterns for extracting and cleaning up the embedded JavaScript object, compiled once
+# since the blob they run over is often hundreds of KB
+_UNQUOTED_KEY_RE = re.compile(r'([{,]\s*)([a-zA-Z_$][\w$]*)\s*:')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+# The script block identified in proto.py, and a direct matchCentreData fallback
+_ARGS_RE = re.compile(r'require\.config\.params\["args"\]\s*=\s*({.*?});', re.DOTALL | re.IGNORECASE)
+_DIRECT_RE = re.compile(r'var\s+matchCentreData\s*=\s*({.*?});', re.DOTALL | re.IGNORECASE)
+
+def _replace_unescaped_single_quotes(js_text: str) -> str:
+    """
+    Replaces every single quote not preceded by a backslash with a double quote.
+
+    Jumps between quotes with str.find and joins the untouched chunks once at the end,
+    so the cost stays linear in the text length (repeated += can go quadratic on PyPy).
+    """
+    parts = []
+    start = 0
+    pos = js_text.find("'")
+    while pos != -1:
+        if pos == 0 or js_text[pos - 1] != "\\":
+            parts.append(js_text[start:pos])
+            parts.append('"')
+            start = pos + 1
+        pos = js_text.find("'", pos + 1)
+    parts.append(js_text[start:])
+    return "".join(parts)
 
 def _js_object_to_json_string(js_text: str) -> str:
     """
     Convert a JavaScript object string to a JSON-compatible string.
     This is a helper function for parsing JavaScript objects embedded in HTML.
 
+    Deprecated: only used when pyjson5 is not installed or fails on the script block.
+
     Args:
         js_text: A string containing a JavaScript object.
 
@@ -40,7 +101,7 @@ def _js_object_to_json_string(js_text: str) -> str:
     """
     # Quote unquoted keys: { keyName: ... } -> { "keyName": ... }
     # Handles keys with alphanumeric characters, underscores, and dollar signs
-    js_text = re.sub(r'([{,]\s*)([a-zA-Z_$][\w$]*)\s*:', r'\1"\2":', js_text)
+    js_text = _UNQUOTED_KEY_RE.sub(r'\1"\2":', js_text)
     
     # Replace single quotes with double quotes for string values,
     # being careful not to replace escaped single quotes or single quotes within double-quoted strings.
@@ -48,7 +109,12 @@ def _js_object_to_json_string(js_text: str) -> str:
     # It looks for ' not preceded by \ (escape) and not followed by ' within a certain distance (heuristic for simple cases)
     # A more robust solution might involve a proper JS parser or more sophisticated regex.
     # For now, this handles many common cases.
-    js_text = re.sub(r"(?<!\\)'", '"', js_text)
+    # Escaped quotes only matter when the blob contains them; otherwise every
+    # single quote is replaced, which a plain str.replace does in one C-level pass
+    if "\\'" in js_text:
+        js_text = _replace_unescaped_single_quotes(js_text)
+    else:
+        js_text = js_text.replace("'", '"')
 
     # Handle boolean values (true, false) - already valid in JSON
     # js_text = re.sub(r'\btrue\b', 'true', js_text) # No change needed
@@ -58,10 +124,49 @@ def _js_object_to_json_string(js_text: str) -> str:
     # js_text = re.sub(r'\bnull\b', 'null', js_text) # No change needed
     
     # Remove trailing commas if any, e.g. [1, 2, ] -> [1, 2] or { "a":1, } -> { "a":1 }
-    js_text = re.sub(r',\s*([}\]])', r'\1', js_text)
+    js_text = _TRAILING_COMMA_RE.sub(r'\1', js_text)
     
     return js_text
 
+# Chrome content settings: 2 = block. Only the page's inline scripts are needed
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> Optional[str]:
+    """
+    Resolves the chromedriver binary via webdriver_manager once per process.
+
+    Returns:
+        Path to the chromedriver binary, or None to use the default ChromeDriver lookup.
+    """
+    try:
+        return ChromeDriverManager().install()
+    except ValueError as e:
+        print(f"WebDriverManager failed: {e}. Attempting to use default ChromeDriver path.")
+        return None
+
+def _extract_script_block(html: str) -> Optional[str]:
+    """
+    Extracts the JavaScript object holding matchCentreData from the page source.
+
+    Both anchors only occur in inline scripts, so the page source is searched directly
+    instead of building a tree just to isolate the <script> tags.
+
+    Args:
+        html: The match page source.
+
+    Returns:
+        The object literal assigned to require.config.params["args"] (or, failing that,
+        to matchCentreData), or None if neither is present.
+    """
+    match = _ARGS_RE.search(html) or _DIRECT_RE.search(html)
+    return match.group(1) if match else None
+
 def setup_match_driver(headless: bool = True, user_agent: str = None) -> webdriver.Chrome:
     """
     Set up a Chrome WebDriver instance specifically for fetching match data.
@@ -79,10 +184,16 @@ def setup_match_driver(headless: bool = True, user_agent: str = None) -> webdriv
         # Using "headless=new" is recommended for modern Chrome versions
         options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu") # Often recommended for headless
     options.add_argument("--window-size=1920,1080") # Define window size
     
+    # Skip images/CSS/fonts/media and return from driver.get() at DOMContentLoaded;
+    # fetch_match_centre_data waits for the data it needs explicitly
+    options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+    options.page_load_strategy = "eager"
+    # DevTools network events, used to find the document's requestId for _page_html_via_cdp
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
     ua = user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     options.add_argument(f"--user-agent={ua}")
     
@@ -92,11 +203,11 @@ def setup_match_driver(headless: bool = True, user_agent: str = None) -> webdriv
     options.add_argument("--disable-blink-features=AutomationControlled") # Another common flag
 
     try:
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-    except ValueError as e:
-        print(f"WebDriverManager failed: {e}. Attempting to use default ChromeDriver path.")
-        driver = webdriver.Chrome(options=options) # Fallback
+        driver_path = _chromedriver_path()
+        if driver_path:
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        else:
+            driver = webdriver.Chrome(options=options) # Fallback
     except Exception as e:
         print(f"Error setting up Chrome driver: {e}")
         raise
@@ -104,17 +215,122 @@ def setup_match_driver(headless: bool = True, user_agent: str = None) -> webdriv
     # Remove navigator.webdriver flag
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
+    # Keep response bodies retrievable with Network.getResponseBody
+    driver.execute_cdp_cmd("Network.enable", {})
+    
     return driver
 
-def fetch_match_centre_data(match_id: str, headless: bool = True, debug: bool = False, output_dir: str = "data/raw/match_debug") -> Dict[str, Any]:
+def _page_html_via_cdp(driver: webdriver.Chrome, match_id: str) -> Optional[str]:
+    """
+    Returns the match page's original HTTP response body via the DevTools protocol.
+
+    Unlike driver.page_source this does not serialize the live DOM; the inline scripts
+    come back exactly as served. Requires a driver from setup_match_driver (performance
+    logging and the Network domain enabled).
+
+    Args:
+        driver: The Selenium WebDriver instance that loaded the match page.
+        match_id: The WhoScored ID of the loaded match.
+
+    Returns:
+        The HTML of the match page, or None if it could not be retrieved.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except WebDriverException as e:
+        print(f"Performance log unavailable ({e}); falling back to page_source.")
+        return None
+
+    # The last document response for this match is the page currently loaded
+    request_id = None
+    match_path = f"/matches/{match_id}/"
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message.get("params", {})
+        if params.get("type") == "Document" and match_path in params.get("response", {}).get("url", ""):
+            request_id = params.get("requestId")
+    if request_id is None:
+        return None
+
+    try:
+        result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+    except WebDriverException as e:
+        print(f"Network.getResponseBody failed for match {match_id}: {e}")
+        return None
+    body = result.get("body")
+    if body and result.get("base64Encoded"):
+        body = base64.b64decode(body).decode("utf-8", errors="replace")
+    return body or None
+
+# Writes debug dumps off the scrape thread so the next match can start loading;
+# flushed at interpreter exit
+_DEBUG_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="match-debug")
+atexit.register(_DEBUG_WRITE_POOL.shutdown, wait=True)
+
+def _write_debug_file(path: str, content: Any, description: str) -> None:
+    """Writes a debug dump (a string, or an object serialized as indented JSON) to path."""
+    try:
+        if not isinstance(content, str):
+            content = json.dumps(content, indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"Saved {description} to: {path}")
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Failed to save {description} to {path}: {e}")
+
+def _match_is_finished(match_data: Dict[str, Any]) -> bool:
+    """True once the match is over; ftScore is only populated at full time (as in proto.py)."""
+    return bool(match_data.get("ftScore"))
+
+def _load_cached_match_data(cache_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached matchCentreData at cache_path, or None if missing, unreadable or
+    not a finished match (only finished matches are cached; anything else is a leftover
+    from older runs and is refetched).
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            match_data = _json_loads(f.read())
+        return match_data if _match_is_finished(match_data) else None
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable match cache {cache_path}: {e}")
+        return None
+
+def _save_cached_match_data(cache_path: str, match_data: Dict[str, Any]) -> None:
+    """Writes match_data to cache_path via a temporary file, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(match_data))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(match_data, f)
+    os.replace(tmp_path, cache_path)
+
+def fetch_match_centre_data(match_id: str, headless: bool = True, debug: bool = False, output_dir: str = "data/raw/match_debug",
+                            driver: Optional[webdriver.Chrome] = None, use_cache: bool = True,
+                            cache_dir: str = DEFAULT_CACHE_DIR) -> Dict[str, Any]:
     """
     Fetches the 'matchCentreData' JavaScript object from a WhoScored match page.
 
+    Finished matches are cached as JSON in cache_dir, so re-running the parsing
+    pipeline doesn't go back to the browser for them. Live and upcoming matches
+    are not cached, since their data is still changing.
+
     Args:
         match_id: The WhoScored ID for the match.
-        headless: Whether to run the browser in headless mode.
+        headless: Whether to run the browser in headless mode (ignored if driver is given).
         debug: If True, saves raw JS and parsed JSON for debugging.
         output_dir: Directory to save debug files.
+        driver: Optional WebDriver from setup_match_driver to reuse (and leave open) across
+            many matches. By default a new one is started and quit for this match only.
+        use_cache: Whether to read from and write to the on-disk cache.
+        cache_dir: Directory holding the cached match_<id>_cache.json files.
 
     Returns:
         A dictionary containing the parsed 'matchCentreData'.
@@ -122,88 +338,111 @@ def fetch_match_centre_data(match_id: str, headless: bool = True, debug: bool =
     Raises:
         RuntimeError: If the data cannot be found or parsed.
     """
+    cache_path = os.path.join(cache_dir, f"match_{match_id}_cache.json")
+    if use_cache:
+        match_data = _load_cached_match_data(cache_path)
+        if match_data is not None:
+            print(f"Loaded cached matchCentreData for match {match_id} from {cache_path}")
+            return match_data
+
+    match_data = _scrape_match_centre_data(match_id, headless, debug, output_dir, driver)
+    if use_cache and _match_is_finished(match_data):
+        try:
+            _save_cached_match_data(cache_path, match_data)
+        except OSError as e:
+            print(f"Could not write match cache {cache_path}: {e}")
+    return match_data
+
+def _scrape_match_centre_data(match_id: str, headless: bool, debug: bool, output_dir: str,
+                              driver: Optional[webdriver.Chrome]) -> Dict[str, Any]:
+    """Loads the match page in the browser and extracts matchCentreData (see fetch_match_centre_data)."""
     url = f"https://www.whoscored.com/matches/{match_id}/Live"
-    driver = None
+    owns_driver = driver is None
     
     print(f"Fetching match data for ID: {match_id} from URL: {url}")
 
     try:
-        driver = setup_match_driver(headless=headless)
+        if owns_driver:
+            driver = setup_match_driver(headless=headless)
+        else:
+            # Don't carry state over from the previous match
+            driver.delete_all_cookies()
+        try:
+            # Drop network events left over from earlier pages
+            driver.get_log("performance")
+        except WebDriverException:
+            pass
         driver.get(url)
         
         # Wait for a known element that indicates page load, e.g., layout wrapper or specific match stats container
         wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
         wait.until(EC.presence_of_element_located((By.ID, "layout-wrapper"))) # As in proto.py
         
-        # Additional explicit wait for JavaScript to execute and populate data
-        print(f"Page loaded. Waiting {DEFAULT_SCRIPT_WAIT_TIME}s for scripts to populate data...")
-        time.sleep(DEFAULT_SCRIPT_WAIT_TIME)
-        
-        html_content = driver.page_source
-        
-        # Parse HTML to find the script tag containing 'matchCentreData'
-        soup = BeautifulSoup(html_content, "lxml")
-        
-        # The target script is usually inside #layout-wrapper and contains 'matchCentreData'
-        # or 'require.config.params["args"]' as seen in proto.py
-        scripts = soup.select("script")
-        target_script_content = None
-        
-        # Look for the script containing 'require.config.params["args"]'
-        # This pattern was identified in the user's proto.py
-        pattern_args = r'require\.config\.params\["args"\]\s*=\s*({.*?});'
+        # Wait until the page's scripts have populated matchCentreData rather than for a fixed time
+        print("Page loaded. Waiting for scripts to populate matchCentreData...")
+        try:
+            wait.until(lambda d: d.execute_script(_MATCH_DATA_READY_JS))
+        except TimeoutException:
+            print(f"matchCentreData not populated within {DEFAULT_TIMEOUT}s; reading the page source anyway.")
+            time.sleep(FALLBACK_SCRIPT_WAIT_TIME)
         
-        for script in scripts:
-            if script.string:
-                match = re.search(pattern_args, script.string, re.DOTALL | re.IGNORECASE)
-                if match:
-                    target_script_content = match.group(1)
-                    print("Found 'require.config.params[\"args\"]' script block.")
-                    break
+        # Fast path: take the object straight from the page's JS context as JSON
+        try:
+            raw_json = driver.execute_script(_MATCH_DATA_JSON_JS)
+        except WebDriverException as e:
+            print(f"Could not read matchCentreData from the page context: {e}")
+            raw_json = None
+        if raw_json:
+            try:
+                match_data = _json_loads(raw_json)
+                print(f"Successfully extracted 'matchCentreData' for match {match_id} from the page context.")
+                return match_data
+            except json.JSONDecodeError as e:
+                print(f"matchCentreData from the page context was not valid JSON: {e}")
         
+        # Fallback: scrape the script block out of the page's HTML, preferably the response
+        # body as served rather than the serialized live DOM
+        html_content = _page_html_via_cdp(driver, match_id)
+        target_script_content = _extract_script_block(html_content) if html_content else None
         if not target_script_content:
-            # Fallback: Look for 'matchCentreData' directly if the above pattern fails
-            pattern_direct = r'var\s+matchCentreData\s*=\s*({.*?});'
-            for script in scripts:
-                if script.string:
-                    match = re.search(pattern_direct, script.string, re.DOTALL | re.IGNORECASE)
-                    if match:
-                        target_script_content = match.group(1)
-                        print("Found 'matchCentreData' directly in a script block.")
-                        break
-            
-        if not target_script_content:
+            html_content = driver.page_source
+            target_script_content = _extract_script_block(html_content)
+        if target_script_content:
+            print("Found the matchCentreData script block.")
+        else:
             if debug:
                 os.makedirs(output_dir, exist_ok=True)
                 debug_html_path = os.path.join(output_dir, f"match_{match_id}_page_source.html")
-                with open(debug_html_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                print(f"Saved full page HTML for debugging: {debug_html_path}")
+                _DEBUG_WRITE_POOL.submit(_write_debug_file, debug_html_path, html_content, "full page HTML")
             raise RuntimeError(f"Could not locate 'matchCentreData' or 'require.config.params[\"args\"]' script block for match {match_id}.")
 
-        # Convert the extracted JavaScript object string to a JSON-like string
-        json_like_string = _js_object_to_json_string(target_script_content)
-        
         if debug:
             os.makedirs(output_dir, exist_ok=True)
             raw_js_path = os.path.join(output_dir, f"match_{match_id}_raw_script_extract.js")
-            json_like_path = os.path.join(output_dir, f"match_{match_id}_json_like_extract.txt")
-            
-            with open(raw_js_path, "w", encoding="utf-8") as f:
-                f.write(target_script_content)
-            print(f"Saved raw extracted JS to: {raw_js_path}")
-            
-            with open(json_like_path, "w", encoding="utf-8") as f:
-                f.write(json_like_string)
-            print(f"Saved JSON-like string to: {json_like_path}")
+            _DEBUG_WRITE_POOL.submit(_write_debug_file, raw_js_path, target_script_content, "raw extracted JS")
 
-        try:
-            # Parse the JSON-like string
-            parsed_data = json.loads(json_like_string)
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse JSON-like string for match {match_id}: {e}")
-            print(f"Problematic string (first 500 chars): {json_like_string[:500]}")
-            raise RuntimeError(f"JSON parsing failed for match {match_id}. Enable debug for details.") from e
+        parsed_data = None
+        if pyjson5 is not None:
+            try:
+                parsed_data = pyjson5.loads(target_script_content)
+            except pyjson5.Json5Exception as e:
+                print(f"JSON5 parsing failed for match {match_id}: {e}. Falling back to regex conversion.")
+
+        if parsed_data is None:
+            # Convert the extracted JavaScript object string to a JSON-like string
+            json_like_string = _js_object_to_json_string(target_script_content)
+
+            if debug:
+                json_like_path = os.path.join(output_dir, f"match_{match_id}_json_like_extract.txt")
+                _DEBUG_WRITE_POOL.submit(_write_debug_file, json_like_path, json_like_string, "JSON-like string")
+
+            try:
+                # Parse the JSON-like string
+                parsed_data = _json_loads(json_like_string)
+            except json.JSONDecodeError as e:
+                print(f"Failed to parse JSON-like string for match {match_id}: {e}")
+                print(f"Problematic string (first 500 chars): {json_like_string[:500]}")
+                raise RuntimeError(f"JSON parsing failed for match {match_id}. Enable debug for details.") from e
 
         # The actual match data is expected to be under a 'matchCentreData' key within the parsed_data
         # if we extracted from 'require.config.params["args"]'
@@ -217,9 +456,7 @@ def fetch_match_centre_data(match_id: str, headless: bool = True, debug: bool =
         else:
             if debug:
                  final_json_path = os.path.join(output_dir, f"match_{match_id}_parsed_full_args.json")
-                 with open(final_json_path, "w", encoding="utf-8") as f:
-                    json.dump(parsed_data, f, indent=2)
-                 print(f"Saved fully parsed args object to: {final_json_path}")
+                 _DEBUG_WRITE_POOL.submit(_write_debug_file, final_json_path, parsed_data, "fully parsed args object")
             raise RuntimeError(f"'matchCentreData' key not found in parsed script data for match {match_id}. Parsed keys: {list(parsed_data.keys())}")
 
     except Exception as e:
@@ -229,7 +466,7 @@ def fetch_match_centre_data(match_id: str, headless: bool = True, debug: bool =
         # Consider re-raising or returning a specific error object
         raise
     finally:
-        if driver:
+        if owns_driver and driver:
             driver.quit()
             print(f"WebDriver closed for match {match_id}.")
 
@@ -246,6 +483,8 @@ if __name__ == "__main__":
     # For now, this script focuses only on fetching data.
 
     # Test with debugging enabled and headless=False to see the browser
+    # One driver is created up front; a batch run would pass it to every fetch
+    shared_driver = None
     try:
         print(f"\n--- Test 1: Fetching data for match ID {test_match_id} (headless=False, debug=True) ---")
         # Make sure the output_dir for debugging exists or can be created
@@ -253,11 +492,12 @@ if __name__ == "__main__":
         if not os.path.exists(debug_output_directory):
             os.makedirs(debug_output_directory)
             
+        shared_driver = setup_match_driver(headless=False)
         match_data = fetch_match_centre_data(
             test_match_id, 
-            headless=False, 
             debug=True, 
-            output_dir=debug_output_directory
+            output_dir=debug_output_directory,
+            driver=shared_driver
         )
         
         if match_data:
@@ -288,6 +528,9 @@ if __name__ == "__main__":
         print(f"An unexpected error occurred during test: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if shared_driver:
+            shared_driver.quit()
 
     # Example of how you might integrate with db.py (conceptual)
     # from ws.db import get_engine, Fixture # Assuming db.py is in the same parent directory or PYTHONPATH is set
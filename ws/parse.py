@@ -16,7 +16,56 @@ import traceback # Import traceback for better error reporting
 
 # NOTE: match_id is now a required argument for both parsing functions
 
-def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competition_id: Optional[int] = None) -> Optional[pd.DataFrame]:
+# Columns of a parsed fixture row stored as nullable integers
+FIXTURE_INT_COLS = ['id', 'competition_id', 'home_team_id', 'away_team_id', 'home_score', 'away_score']
+
+def _coerce_dtypes(df: pd.DataFrame, int_cols: List[str], float_cols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Coerces the given columns (where present) to nullable Int64/Float64 in one sweep.
+
+    Values that cannot be parsed as numbers become <NA>.
+
+    Args:
+        df: The DataFrame to convert.
+        int_cols: Columns to convert to Int64.
+        float_cols: Columns to convert to Float64.
+
+    Returns:
+        The DataFrame with the converted columns.
+    """
+    present_int = [col for col in int_cols if col in df.columns]
+    present_float = [col for col in float_cols or [] if col in df.columns]
+    numeric_cols = present_int + present_float
+    if not numeric_cols:
+        return df
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+    return df.astype({**{col: 'Int64' for col in present_int}, **{col: 'Float64' for col in present_float}})
+
+# Schema column suffix -> key of the per-minute stat dict under matchCentreData home/away 'stats'
+STAT_KEYS_MAP = {
+    "possession": "possession",
+    "rating": "ratings",
+    "total_shots": "shotsTotal",
+    "pass_success": "passSuccess",
+    "dribbles": "dribblesWon",
+    "aerial_won": "aerialsWon",
+    "tackles": "tackleSuccessful",
+    "corners": "cornersTotal"
+}
+# (json_key, home column, away column) for each stat, so column names are built once
+_MINUTE_STAT_COLUMNS = tuple(
+    (json_key, f"{suffix}_home", f"{suffix}_away") for suffix, json_key in STAT_KEYS_MAP.items()
+)
+
+def _minute_stat_lookups(stats_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Maps each stat key in STAT_KEYS_MAP to its minute-keyed dict, or {} if absent or not a dict."""
+    lookups = {}
+    for json_key in STAT_KEYS_MAP.values():
+        stat_dict = stats_data.get(json_key)
+        lookups[json_key] = stat_dict if isinstance(stat_dict, dict) else {}
+    return lookups
+
+def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competition_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
     Parses the general fixture information from the match data dictionary.
 
@@ -26,7 +75,7 @@ def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competiti
         competition_id: Optional competition ID to associate with this fixture.
 
     Returns:
-        A single-row Pandas DataFrame containing fixture details, or None if essential data is missing.
+        A dictionary of fixture details (one row; see fixtures_to_frame), or None if essential data is missing.
     """
     if not match_data_dict:
         print(f"Error: Input match_data_dict is empty for match ID {match_id}. Cannot parse fixture.")
@@ -38,24 +87,24 @@ def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competiti
         datetime_utc = None
         if start_date_str:
             try:
-                # Add 'Z' if timestamp doesn't have timezone info, assuming UTC
-                if 'Z' not in start_date_str and '+' not in start_date_str and '-' not in start_date_str[10:]: # Check if timezone info exists
-                     if '.' in start_date_str: # Handle milliseconds if present
-                         dt_obj = datetime.strptime(start_date_str, "%Y-%m-%dT%H:%M:%S.%f")
-                     else:
-                         dt_obj = datetime.strptime(start_date_str, "%Y-%m-%dT%H:%M:%S")
-                     datetime_utc = dt_obj.replace(tzinfo=timezone.utc)
-                else:
-                    # Let fromisoformat handle timezone if present
+                try:
+                    # WhoScored sends e.g. "2024-03-03T15:30:00"; naive timestamps are assumed to be UTC
                     dt_obj = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-                    datetime_utc = dt_obj.astimezone(timezone.utc)
-
+                except ValueError:
+                    # Slow path for anything fromisoformat rejects on this interpreter
+                    fmt = "%Y-%m-%dT%H:%M:%S.%f" if '.' in start_date_str else "%Y-%m-%dT%H:%M:%S"
+                    dt_obj = datetime.strptime(start_date_str, fmt)
+                datetime_utc = dt_obj.replace(tzinfo=timezone.utc) if dt_obj.tzinfo is None else dt_obj.astimezone(timezone.utc)
             except ValueError as e:
                 print(f"Warning: Could not parse startDate '{start_date_str}' for match {match_id}. Error: {e}")
                 datetime_utc = datetime.now(timezone.utc) # Placeholder
 
-        home_team_data = match_data_dict.get("home", {})
-        away_team_data = match_data_dict.get("away", {})
+        # Bind the nested objects once; `or {}` also covers keys present with a null value
+        home_team_data = match_data_dict.get("home") or {}
+        away_team_data = match_data_dict.get("away") or {}
+        referee = match_data_dict.get("referee") or {}
+        venue = match_data_dict.get("venue") or {}
+        stage = match_data_dict.get("stage") or {}
 
         data = {
             "id": match_id, # Use the passed-in match_id
@@ -64,7 +113,7 @@ def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competiti
             # Check 'statusDescription' or 'detailedStatus', 'statusCode' might be useful too
             "status": match_data_dict.get("statusDescription") or match_data_dict.get("detailedStatus") or match_data_dict.get("status"),
             # 'stage' might not exist directly, check if needed elsewhere
-            "round_name": match_data_dict.get("stage", {}).get("stageName"),
+            "round_name": stage.get("stageName"),
 
             "home_team_id": home_team_data.get("teamId"),
             "home_team_name": home_team_data.get("name"),
@@ -74,8 +123,8 @@ def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competiti
             "home_score": None,
             "away_score": None,
 
-            "referee_name": match_data_dict.get("referee", {}).get("name") or match_data_dict.get("referee", {}).get("officialName"), # Try 'name' first
-            "venue_name": match_data_dict.get("venueName") or match_data_dict.get("venue", {}).get("name"), # Try 'venueName' first
+            "referee_name": referee.get("name") or referee.get("officialName"), # Try 'name' first
+            "venue_name": match_data_dict.get("venueName") or venue.get("name"), # Try 'venueName' first
 
             "scraped_at": datetime.now(timezone.utc)
         }
@@ -102,22 +151,26 @@ def parse_fixture_data(match_id: int, match_data_dict: Dict[str, Any], competiti
              data["home_score"] = match_data_dict.get("homeScore")
              data["away_score"] = match_data_dict.get("awayScore")
 
-
-        df = pd.DataFrame([data])
-
-        # Ensure correct dtypes
-        int_cols = ['id', 'competition_id', 'home_team_id', 'away_team_id', 'home_score', 'away_score']
-        for col in int_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-
-        return df
+        return data
 
     except Exception as e:
         print(f"Error parsing fixture data for match ID {match_id}: {e}")
         traceback.print_exc()
         return None
 
+def fixtures_to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Builds one DataFrame from many rows returned by parse_fixture_data.
+
+    Args:
+        rows: Fixture dictionaries from parse_fixture_data.
+
+    Returns:
+        A Pandas DataFrame with one row per fixture and nullable integer ID/score columns.
+    """
+    df = pd.DataFrame.from_records(rows)
+    return _coerce_dtypes(df, FIXTURE_INT_COLS)
+
 def parse_minute_data(match_id: int, match_data_dict: Dict[str, Any]) -> Optional[pd.DataFrame]:
     """
     Parses minute-by-minute statistics from the match data dictionary.
@@ -134,69 +187,43 @@ def parse_minute_data(match_id: int, match_data_dict: Dict[str, Any]) -> Optiona
         print(f"Error: Input match_data_dict is empty for match ID {match_id}. Cannot parse minute data.")
         return None
 
-    home_stats_data = match_data_dict.get("home", {}).get("stats", {})
-    away_stats_data = match_data_dict.get("away", {}).get("stats", {})
+    home_stats_data = (match_data_dict.get("home") or {}).get("stats") or {}
+    away_stats_data = (match_data_dict.get("away") or {}).get("stats") or {}
 
     if not home_stats_data and not away_stats_data:
         print(f"Warning: No 'stats' data found for home or away team for match {match_id}. Returning empty DataFrame for minute data.")
         return pd.DataFrame()
 
-    all_minutes_data: List[Dict[str, Any]] = []
-
-    stat_keys_map = {
-        "possession": "possession",
-        "rating": "ratings",
-        "total_shots": "shotsTotal",
-        "pass_success": "passSuccess",
-        "dribbles": "dribblesWon",
-        "aerial_won": "aerialsWon",
-        "tackles": "tackleSuccessful",
-        "corners": "cornersTotal"
-    }
+    # Look up each stat's minute dict once per team; missing or malformed stats become {}
+    home_lookups = _minute_stat_lookups(home_stats_data)
+    away_lookups = _minute_stat_lookups(away_stats_data)
 
-    observed_minutes = set()
-    for stat_json_key in stat_keys_map.values():
-        # Check if the stat key exists and is a dictionary before accessing keys
-        home_stat_val = home_stats_data.get(stat_json_key)
-        if isinstance(home_stat_val, dict):
-            observed_minutes.update(home_stat_val.keys())
+    # Collect the minutes seen in any stat in one pass over the dict keys,
+    # skipping non-digit keys like "fullGame"
+    numeric_minutes = sorted({
+        int(minute) for stat_dict in (*home_lookups.values(), *away_lookups.values())
+        for minute in stat_dict if minute.isdigit()
+    })
 
-        away_stat_val = away_stats_data.get(stat_json_key)
-        if isinstance(away_stat_val, dict):
-            observed_minutes.update(away_stat_val.keys())
-
-    if not observed_minutes:
+    if not numeric_minutes:
         print(f"Warning: No minute-keyed statistics found for match {match_id}. Returning empty DataFrame for minute data.")
         return pd.DataFrame()
 
-    # Filter out non-digit keys like "fullGame" before sorting
-    numeric_minutes = sorted([int(m) for m in observed_minutes if m.isdigit()])
-
-    current_scraped_at = datetime.now(timezone.utc)
-
-    for minute_val in numeric_minutes:
-        minute_str = str(minute_val)
-        minute_entry: Dict[str, Any] = {
-            "match_id": match_id, # Use the passed-in match_id
-            "minute": minute_val,
-            "added_time": None, # Still not directly available per minute
-            "scraped_at": current_scraped_at
-        }
-
-        for schema_suffix, json_key in stat_keys_map.items():
-            home_stat_dict = home_stats_data.get(json_key, {})
-            minute_entry[f"{schema_suffix}_home"] = home_stat_dict.get(minute_str) if isinstance(home_stat_dict, dict) else None
-
-            away_stat_dict = away_stats_data.get(json_key, {})
-            minute_entry[f"{schema_suffix}_away"] = away_stat_dict.get(minute_str) if isinstance(away_stat_dict, dict) else None
-
-        all_minutes_data.append(minute_entry)
-
-    if not all_minutes_data:
-        print(f"No minute data processed for match {match_id}. Returning empty DataFrame.")
-        return pd.DataFrame()
+    # Build the frame column-wise: one Series per stat and side, aligned on the minute keys,
+    # instead of a dict per minute. Minutes missing from a stat become NaN.
+    minute_keys = [str(m) for m in numeric_minutes]
+    columns: Dict[str, Any] = {
+        "match_id": match_id, # Use the passed-in match_id
+        "minute": numeric_minutes,
+        "added_time": None, # Still not directly available per minute
+        "scraped_at": datetime.now(timezone.utc)
+    }
+    for json_key, home_col, away_col in _MINUTE_STAT_COLUMNS:
+        columns[home_col] = pd.Series(home_lookups[json_key], dtype="object").reindex(minute_keys).to_numpy()
+        columns[away_col] = pd.Series(away_lookups[json_key], dtype="object").reindex(minute_keys).to_numpy()
 
-    df = pd.DataFrame(all_minutes_data)
+    # Scalars (match_id, added_time, scraped_at) are broadcast to every minute
+    df = pd.DataFrame(columns)
 
     int_cols = ['match_id', 'minute', 'added_time',
                 'total_shots_home', 'total_shots_away',
@@ -209,15 +236,7 @@ def parse_minute_data(match_id: int, match_data_dict: Dict[str, Any]) -> Optiona
                   'rating_home', 'rating_away',
                   'pass_success_home', 'pass_success_away']
 
-    for col in int_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-
-    for col in float_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Float64')
-
-    return df
+    return _coerce_dtypes(df, int_cols, float_cols)
 
 # --- Example Usage (for testing this module directly) ---
 if __name__ == "__main__":
@@ -278,12 +297,13 @@ if __name__ == "__main__":
         # Test parse_fixture_data
         print("\n--- Testing parse_fixture_data ---")
         test_competition_id = 101 # Example competition ID
-        fixture_df = parse_fixture_data(
+        fixture_row = parse_fixture_data(
             match_id=test_match_id_to_use, # Pass the ID explicitly
             match_data_dict=actual_match_data_to_parse,
             competition_id=test_competition_id
         )
-        if fixture_df is not None:
+        if fixture_row is not None:
+            fixture_df = fixtures_to_frame([fixture_row])
             print("Fixture DataFrame:")
             print(fixture_df.head().to_string())
             print("\nFixture DataFrame Info:")